@@ -0,0 +1,90 @@
+"""
+Benchmark dos formatos de arquivo de dados.
+Compara tamanho em disco e tempo de gravação/leitura do JSON indentado,
+do JSON compacto e dos contêineres zlib e lzma.
+
+Uso:
+    python -m benchmarks.compressao [quantidade]
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src import compressao
+from src.tarefa import Tarefa
+
+PALAVRAS = (
+    "revisar fluxo aprovação time produto registrar critérios aceite "
+    "atualizar documentação sprint cliente relatório integração API banco "
+    "dados testes deploy homologação corrigir erro tela cadastro login "
+    "pagamento notificação desempenho consulta índice migração versão"
+).split()
+
+
+def gerar_tarefas(quantidade):
+    """Gera tarefas com descrições longas, como as de um quadro real."""
+    prioridades = ("Baixa", "Média", "Alta")
+    status = ("A Fazer", "Em Progresso", "Concluído")
+    aleatorio = random.Random(42)
+    tarefas = []
+    for i in range(1, quantidade + 1):
+        descricao = " ".join(aleatorio.choices(PALAVRAS, k=aleatorio.randint(20, 200)))
+        tarefa = Tarefa(i, f"Tarefa {i}", descricao, prioridades[i % 3])
+        tarefa.status = status[i % 3]
+        tarefas.append(tarefa)
+    return tarefas
+
+
+def gravar_json(caminho, tarefas, indent):
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        dados = {"proximo_id": len(tarefas) + 1, "tarefas": [t.to_dict() for t in tarefas]}
+        json.dump(dados, arquivo, indent=indent, ensure_ascii=False)
+
+
+def ler_json(caminho):
+    with open(caminho, 'r', encoding='utf-8') as arquivo:
+        return json.load(arquivo)["tarefas"]
+
+
+def medir(nome, gravar, ler, caminho, bruto):
+    """Grava e lê o arquivo, imprimindo tamanho e vazão."""
+    inicio = time.perf_counter()
+    gravar(caminho)
+    escrita = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    ler(caminho)
+    leitura = time.perf_counter() - inicio
+    tamanho = os.path.getsize(caminho)
+    print(
+        f"{nome:<16} {tamanho / 1e6:8.2f} MB  {bruto / tamanho:6.1f}x  "
+        f"grava {bruto / 1e6 / escrita:7.1f} MB/s  lê {bruto / 1e6 / leitura:7.1f} MB/s"
+    )
+
+
+def main(quantidade=20_000):
+    """Roda o benchmark com a quantidade informada de tarefas."""
+    tarefas = gerar_tarefas(quantidade)
+    proximo_id = quantidade + 1
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = os.path.join(diretorio, "tarefas")
+        gravar_json(caminho, tarefas, 4)
+        bruto = os.path.getsize(caminho)
+
+        print(f"=== {quantidade} tarefas (taxas relativas ao JSON indentado) ===")
+        medir("JSON indent=4", lambda c: gravar_json(c, tarefas, 4), ler_json, caminho, bruto)
+        medir("JSON compacto", lambda c: gravar_json(c, tarefas, None), ler_json, caminho, bruto)
+        for codec in compressao.CODECS:
+            medir(
+                codec,
+                lambda c: compressao.gravar(c, proximo_id, tarefas, codec),
+                compressao.ler,
+                caminho,
+                bruto,
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
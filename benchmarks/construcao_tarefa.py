@@ -0,0 +1,34 @@
+"""
+Micro-benchmark da construção de tarefas.
+Compara a criação direta, from_dict e o caminho confiável de from_dict.
+
+Uso:
+    python -m benchmarks.construcao_tarefa [quantidade]
+"""
+import sys
+import time
+
+from src.tarefa import Tarefa
+
+
+def medir(nome, funcao, quantidade):
+    """Executa a função N vezes e imprime o tempo total e por chamada."""
+    inicio = time.perf_counter()
+    for i in range(quantidade):
+        funcao(i)
+    duracao = time.perf_counter() - inicio
+    print(f"{nome:<28} {duracao:8.3f} s  {duracao / quantidade * 1e9:8.0f} ns/tarefa")
+
+
+def main(quantidade=1_000_000):
+    """Roda o benchmark com a quantidade informada de construções."""
+    dados = Tarefa(1, "Tarefa", "Descrição", "Alta").to_dict()
+
+    print(f"=== Construção de {quantidade} tarefas ===")
+    medir("Tarefa(...)", lambda i: Tarefa(i, "Tarefa", "Descrição", "Alta"), quantidade)
+    medir("Tarefa.from_dict", lambda i: Tarefa.from_dict(dados), quantidade)
+    medir("Tarefa.from_dict confiável", lambda i: Tarefa.from_dict(dados, confiavel=True), quantidade)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
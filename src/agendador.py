@@ -0,0 +1,114 @@
+"""
+Módulo do agendador de tarefas pendentes.
+Mantém um heap por prioridade com as tarefas "A Fazer" ordenadas pela
+data de criação, para obter a próxima tarefa em O(log n).
+"""
+import heapq
+from itertools import count
+from src.tarefa import Tarefa
+
+
+class Agendador:
+    """
+    Fila de prioridade das tarefas "A Fazer" prontas para execução.
+
+    Entradas antigas não são removidas dos heaps: cada tarefa guarda o
+    token da sua entrada válida e as demais são descartadas ao chegar
+    ao topo (remoção preguiçosa). Quando as entradas obsoletas passam a
+    ser maioria, os heaps são reconstruídos só com as válidas.
+    """
+
+    # Entradas toleradas antes de considerar a compactação
+    MINIMO_COMPACTACAO = 64
+
+    def __init__(self, tarefas=(), pronta=None):
+        """
+        Inicializa o agendador.
+
+        Args:
+            tarefas (iterable): Tarefas iniciais
+            pronta (callable): Recebe o ID e indica se a tarefa pode ser
+                iniciada (ex. sem dependências pendentes); quem o informa
+                deve chamar atualizar quando a resposta mudar
+        """
+        self._contador = count()
+        self._pronta = pronta or (lambda id_tarefa: True)
+        self.reconstruir(tarefas)
+
+    def reconstruir(self, tarefas):
+        """
+        Reconstrói os heaps a partir de uma sequência de tarefas.
+
+        Args:
+            tarefas (iterable): Tarefas do quadro
+        """
+        self._heaps = {p: [] for p in Tarefa.PRIORIDADES_VALIDAS}
+        self._tokens = {}
+        for tarefa in tarefas:
+            if self._na_fila(tarefa):
+                self._heaps[tarefa.prioridade].append(self._nova_entrada(tarefa))
+        for heap in self._heaps.values():
+            heapq.heapify(heap)
+        self._entradas = len(self._tokens)
+
+    def _na_fila(self, tarefa):
+        """Indica se a tarefa deve estar na fila."""
+        return tarefa.status == "A Fazer" and self._pronta(tarefa.id)
+
+    def _nova_entrada(self, tarefa):
+        """Cria a entrada de heap de uma tarefa e a marca como válida."""
+        token = next(self._contador)
+        self._tokens[tarefa.id] = token
+        # O ID desempata datas iguais, então a tarefa nunca é comparada
+        return (tarefa.data_criacao, tarefa.id, token, tarefa)
+
+    def atualizar(self, tarefa):
+        """
+        Reposiciona uma tarefa criada ou alterada.
+
+        Args:
+            tarefa (Tarefa): Tarefa com os valores atuais
+        """
+        if self._na_fila(tarefa):
+            heapq.heappush(self._heaps[tarefa.prioridade], self._nova_entrada(tarefa))
+            self._entradas += 1
+        else:
+            self._tokens.pop(tarefa.id, None)
+        self._compactar_se_necessario()
+
+    def remover(self, id_tarefa):
+        """
+        Retira uma tarefa da fila.
+
+        Args:
+            id_tarefa (int): ID da tarefa
+        """
+        self._tokens.pop(id_tarefa, None)
+        self._compactar_se_necessario()
+
+    def _compactar_se_necessario(self):
+        """Reconstrói os heaps quando as entradas obsoletas superam as válidas."""
+        if self._entradas <= max(2 * len(self._tokens), self.MINIMO_COMPACTACAO):
+            return
+        for prioridade, heap in self._heaps.items():
+            heap = [e for e in heap if self._tokens.get(e[1]) == e[2]]
+            heapq.heapify(heap)
+            self._heaps[prioridade] = heap
+        self._entradas = len(self._tokens)
+
+    def proxima(self):
+        """
+        Retorna a tarefa "A Fazer" pronta de maior prioridade e mais antiga.
+
+        Returns:
+            Tarefa: Próxima tarefa ou None se não houver pendentes
+        """
+        for prioridade in Tarefa.PRIORIDADES_VALIDAS:
+            heap = self._heaps[prioridade]
+            while heap:
+                _, id_tarefa, token, tarefa = heap[0]
+                if self._tokens.get(id_tarefa) == token:
+                    return tarefa
+                heapq.heappop(heap)
+                self._entradas -= 1
+        return None
@@ -0,0 +1,309 @@
+"""
+Módulo de armazenamento em registros de tamanho fixo acessados via mmap.
+Alternativa ao arquivo JSON: alterações de status e prioridade viram
+escritas de poucos bytes no próprio registro, sem reescrever o arquivo.
+"""
+import mmap
+import os
+import struct
+from src.tarefa import Tarefa
+
+MAGICO = b"TRFM"
+VERSAO = 2
+
+# magico, versao, proximo_id, quantidade de registros, capacidade
+CABECALHO = struct.Struct("<4sB3xqqq")
+# id, status, prioridade, flags, data_criacao, data_conclusao,
+# posição no heap e tamanhos (em bytes) do título e da descrição,
+# posição no heap e tamanhos do responsável e das dependências
+REGISTRO = struct.Struct("<qBBB19s19sQIIQII")
+
+# Deslocamentos dos campos alteráveis dentro de um registro
+_POS_CODIGOS = 8
+_CODIGOS = struct.Struct("<BBB")
+_POS_CONCLUSAO = 30
+_CONCLUSAO = struct.Struct("<19s")
+_POS_VARIAVEIS = 65
+_VARIAVEIS = struct.Struct("<QII")
+
+FLAG_REMOVIDO = 1
+FLAG_CONCLUSAO = 2
+
+CAPACIDADE_INICIAL = 64
+# Bytes mortos no heap tolerados antes de compactar ao carregar
+LIMITE_COMPACTACAO = 64 * 1024
+
+
+class ArmazenamentoMmap:
+    """
+    Armazenamento de tarefas em um arquivo de registros de tamanho fixo.
+
+    Os campos de tamanho variável (título, descrição, responsável e IDs das
+    dependências) ficam em um heap separado, somente de acréscimo,
+    referenciado por posição e tamanho a partir do registro. Título e
+    descrição não mudam após a criação; responsável e dependências têm
+    uma referência própria, para que só eles sejam regravados. O heap é
+    compactado ao carregar quando acumula bytes mortos demais.
+
+    Atributos:
+        caminho (str): Caminho do arquivo de registros
+        caminho_heap (str): Caminho do arquivo de textos
+    """
+
+    def __init__(self, caminho):
+        """
+        Inicializa o armazenamento.
+
+        Args:
+            caminho (str): Caminho do arquivo de registros
+        """
+        self.caminho = caminho
+        self.caminho_heap = caminho + ".heap"
+        self._arquivo = None
+        self._mapa = None
+        self._slots = {}
+        self._variaveis = {}
+
+    def _abrir(self):
+        """Mapeia o arquivo de registros em memória."""
+        self.fechar()
+        self._arquivo = open(self.caminho, 'r+b')
+        self._mapa = mmap.mmap(self._arquivo.fileno(), 0)
+
+    def fechar(self):
+        """Libera o mapeamento e o arquivo de registros."""
+        if self._mapa is not None:
+            self._mapa.flush()
+            self._mapa.close()
+            self._mapa = None
+        if self._arquivo is not None:
+            self._arquivo.close()
+            self._arquivo = None
+
+    def _cabecalho(self):
+        """Lê (proximo_id, quantidade, capacidade) do cabeçalho."""
+        magico, versao, proximo_id, quantidade, capacidade = CABECALHO.unpack_from(self._mapa, 0)
+        if magico != MAGICO or versao != VERSAO:
+            raise ValueError(f"Arquivo de registros inválido: {self.caminho}")
+        return proximo_id, quantidade, capacidade
+
+    def _escrever_cabecalho(self, proximo_id, quantidade, capacidade):
+        """Grava o cabeçalho no início do mapeamento."""
+        CABECALHO.pack_into(self._mapa, 0, MAGICO, VERSAO, proximo_id, quantidade, capacidade)
+
+    @staticmethod
+    def _posicao(slot):
+        """Retorna a posição em bytes de um registro no arquivo."""
+        return CABECALHO.size + slot * REGISTRO.size
+
+    @staticmethod
+    def _codigos(tarefa):
+        """Codifica os campos alteráveis de uma tarefa."""
+        flags = FLAG_CONCLUSAO if tarefa.data_conclusao is not None else 0
+        return (
+            Tarefa.STATUS_VALIDOS.index(tarefa.status),
+            Tarefa.PRIORIDADES_VALIDAS.index(tarefa.prioridade),
+            flags,
+            (tarefa.data_conclusao or "").encode("ascii")
+        )
+
+    @staticmethod
+    def _textos(tarefa):
+        """Codifica o título e a descrição de uma tarefa."""
+        return (tarefa.titulo.encode("utf-8"), tarefa.descricao.encode("utf-8"))
+
+    @staticmethod
+    def _textos_variaveis(tarefa):
+        """Codifica o responsável e as dependências de uma tarefa."""
+        return (
+            (tarefa.responsavel or "").encode("utf-8"),
+            struct.pack("<%dq" % len(tarefa.dependencias), *tarefa.dependencias)
+        )
+
+    @staticmethod
+    def _variaveis_alteraveis(tarefa):
+        """Retorna os campos variáveis que podem mudar após a criação."""
+        return (tarefa.responsavel, tuple(tarefa.dependencias))
+
+    @classmethod
+    def _empacotar(cls, tarefa, posicao_heap):
+        """Monta o registro e o texto de uma tarefa."""
+        textos = cls._textos(tarefa)
+        variaveis = cls._textos_variaveis(tarefa)
+        tamanho_textos = sum(len(t) for t in textos)
+        status, prioridade, flags, data_conclusao = cls._codigos(tarefa)
+        registro = REGISTRO.pack(
+            tarefa.id, status, prioridade, flags,
+            tarefa.data_criacao.encode("ascii"), data_conclusao,
+            posicao_heap, *(len(t) for t in textos),
+            posicao_heap + tamanho_textos, *(len(t) for t in variaveis)
+        )
+        return registro, b"".join(textos + variaveis)
+
+    def existe(self):
+        """
+        Indica se o arquivo de registros já existe.
+
+        Returns:
+            bool: True se o arquivo existe
+        """
+        return os.path.exists(self.caminho)
+
+    def salvar(self, proximo_id, tarefas):
+        """
+        Reescreve e compacta os arquivos com todas as tarefas.
+
+        Args:
+            proximo_id (int): Próximo ID disponível
+            tarefas (list): Tarefas a gravar
+        """
+        self.fechar()
+        capacidade = max(CAPACIDADE_INICIAL, 2 * len(tarefas))
+        registros = []
+        textos = []
+        posicao_heap = 0
+        for tarefa in tarefas:
+            registro, texto = self._empacotar(tarefa, posicao_heap)
+            registros.append(registro)
+            textos.append(texto)
+            posicao_heap += len(texto)
+
+        with open(self.caminho_heap, 'wb') as heap:
+            heap.write(b"".join(textos))
+        with open(self.caminho, 'wb') as arquivo:
+            arquivo.write(CABECALHO.pack(MAGICO, VERSAO, proximo_id, len(tarefas), capacidade))
+            arquivo.write(b"".join(registros))
+            arquivo.truncate(self._posicao(capacidade))
+
+        self._slots = {t.id: slot for slot, t in enumerate(tarefas)}
+        self._variaveis = {t.id: self._variaveis_alteraveis(t) for t in tarefas}
+        self._abrir()
+
+    def carregar(self):
+        """
+        Mapeia o arquivo e reconstrói as tarefas a partir dos registros.
+
+        Se o heap acumulou mais de LIMITE_COMPACTACAO bytes que nenhum
+        registro referencia, os arquivos são reescritos compactados.
+
+        Returns:
+            tuple: (proximo_id, lista de tarefas ordenada pelo ID)
+        """
+        self._abrir()
+        proximo_id, quantidade, _ = self._cabecalho()
+        with open(self.caminho_heap, 'rb') as arquivo:
+            heap = arquivo.read()
+
+        status_validos = Tarefa.STATUS_VALIDOS
+        prioridades_validas = Tarefa.PRIORIDADES_VALIDAS
+        self._slots = {}
+        self._variaveis = {}
+        tarefas = []
+        vivos = 0
+        for slot, campos in enumerate(REGISTRO.iter_unpack(
+                self._mapa[CABECALHO.size:self._posicao(quantidade)])):
+            (id_tarefa, status, prioridade, flags, data_criacao,
+             data_conclusao, posicao, tam_titulo, tam_descricao,
+             posicao_variaveis, tam_responsavel, tam_dependencias) = campos
+            if flags & FLAG_REMOVIDO:
+                continue
+            vivos += tam_titulo + tam_descricao + tam_responsavel + tam_dependencias
+            fim_titulo = posicao + tam_titulo
+            fim_descricao = fim_titulo + tam_descricao
+            fim_responsavel = posicao_variaveis + tam_responsavel
+            responsavel = heap[posicao_variaveis:fim_responsavel].decode("utf-8") or None
+            dependencias = list(struct.unpack_from("<%dq" % (tam_dependencias // 8), heap, fim_responsavel))
+            tarefa = Tarefa.from_dict({
+                "id": id_tarefa,
+                "titulo": heap[posicao:fim_titulo].decode("utf-8"),
+                "descricao": heap[fim_titulo:fim_descricao].decode("utf-8"),
+                "prioridade": prioridades_validas[prioridade],
+                "status": status_validos[status],
+                "data_criacao": data_criacao.decode("ascii"),
+                "data_conclusao": data_conclusao.decode("ascii") if flags & FLAG_CONCLUSAO else None,
+                "responsavel": responsavel,
+                "dependencias": dependencias
+            }, confiavel=True)
+            tarefas.append(tarefa)
+            self._slots[id_tarefa] = slot
+            self._variaveis[id_tarefa] = self._variaveis_alteraveis(tarefa)
+        # Tarefas restauradas por desfazer são acrescentadas ao final
+        tarefas.sort(key=lambda t: t.id)
+        if len(heap) - vivos > LIMITE_COMPACTACAO:
+            self.salvar(proximo_id, tarefas)
+        return proximo_id, tarefas
+
+    def anexar(self, tarefa, proximo_id):
+        """
+        Acrescenta o registro de uma nova tarefa.
+
+        Args:
+            tarefa (Tarefa): Tarefa criada
+            proximo_id (int): Próximo ID disponível após a criação
+        """
+        _, quantidade, capacidade = self._cabecalho()
+        if quantidade == capacidade:
+            capacidade *= 2
+            self._mapa.close()
+            self._arquivo.truncate(self._posicao(capacidade))
+            self._mapa = mmap.mmap(self._arquivo.fileno(), 0)
+
+        with open(self.caminho_heap, 'ab') as heap:
+            registro, texto = self._empacotar(tarefa, heap.tell())
+            heap.write(texto)
+        posicao = self._posicao(quantidade)
+        self._mapa[posicao:posicao + REGISTRO.size] = registro
+        self._slots[tarefa.id] = quantidade
+        self._variaveis[tarefa.id] = self._variaveis_alteraveis(tarefa)
+        self._escrever_cabecalho(proximo_id, quantidade + 1, capacidade)
+
+    def atualizar(self, tarefa):
+        """
+        Reescreve no lugar status, prioridade e data de conclusão.
+
+        Se o responsável ou as dependências mudaram, apenas esses campos
+        são acrescentados ao heap e a referência deles no registro é
+        reescrita; título e descrição não são copiados.
+
+        Args:
+            tarefa (Tarefa): Tarefa alterada
+
+        Returns:
+            bool: True se a tarefa estava no arquivo
+        """
+        slot = self._slots.get(tarefa.id)
+        if slot is None:
+            return False
+        status, prioridade, flags, data_conclusao = self._codigos(tarefa)
+        posicao = self._posicao(slot)
+        _CODIGOS.pack_into(self._mapa, posicao + _POS_CODIGOS, status, prioridade, flags)
+        _CONCLUSAO.pack_into(self._mapa, posicao + _POS_CONCLUSAO, data_conclusao)
+        variaveis = self._variaveis_alteraveis(tarefa)
+        if variaveis != self._variaveis.get(tarefa.id):
+            textos = self._textos_variaveis(tarefa)
+            with open(self.caminho_heap, 'ab') as heap:
+                posicao_heap = heap.tell()
+                heap.write(b"".join(textos))
+            _VARIAVEIS.pack_into(
+                self._mapa, posicao + _POS_VARIAVEIS, posicao_heap, *(len(t) for t in textos)
+            )
+            self._variaveis[tarefa.id] = variaveis
+        return True
+
+    def remover(self, id_tarefa):
+        """
+        Marca o registro de uma tarefa como removido.
+
+        Args:
+            id_tarefa (int): ID da tarefa removida
+
+        Returns:
+            bool: True se a tarefa estava no arquivo
+        """
+        slot = self._slots.pop(id_tarefa, None)
+        self._variaveis.pop(id_tarefa, None)
+        if slot is None:
+            return False
+        posicao = self._posicao(slot) + _POS_CODIGOS + 2
+        self._mapa[posicao] = self._mapa[posicao] | FLAG_REMOVIDO
+        return True
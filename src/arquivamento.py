@@ -0,0 +1,115 @@
+"""
+Módulo de arquivamento de tarefas concluídas.
+Move tarefas antigas para um arquivo compactado, somente de acréscimo,
+mantendo apenas contagens agregadas em memória.
+"""
+import gzip
+import json
+import os
+from src.tarefa import Tarefa
+
+
+class Arquivamento:
+    """
+    Arquivo morto de tarefas concluídas.
+
+    O arquivo de tarefas é um JSON Lines compactado com gzip; cada
+    arquivamento acrescenta um novo membro gzip ao final do arquivo.
+
+    Atributos:
+        arquivo_tarefas (str): Caminho do arquivo compactado de tarefas
+        arquivo_contagens (str): Caminho do arquivo com as contagens agregadas
+    """
+
+    def __init__(self, arquivo_dados):
+        """
+        Inicializa o arquivo morto ao lado do arquivo de dados.
+
+        Args:
+            arquivo_dados (str): Caminho do arquivo de dados principal
+        """
+        base = os.path.splitext(arquivo_dados)[0]
+        self.arquivo_tarefas = base + ".arquivo.jsonl.gz"
+        self.arquivo_contagens = base + ".arquivo.json"
+        self._contagens = self._carregar_contagens()
+
+    def _carregar_contagens(self):
+        """Carrega as contagens agregadas ou retorna contagens zeradas."""
+        contagens = {
+            "total": 0,
+            "por_prioridade": {p: 0 for p in Tarefa.PRIORIDADES_VALIDAS}
+        }
+        if os.path.exists(self.arquivo_contagens):
+            try:
+                with open(self.arquivo_contagens, 'r', encoding='utf-8') as arquivo:
+                    contagens = json.load(arquivo)
+            except Exception as e:
+                print(f"Erro ao carregar contagens do arquivo morto: {e}")
+        return contagens
+
+    def anexar(self, tarefas):
+        """
+        Acrescenta tarefas ao arquivo morto.
+
+        Args:
+            tarefas (list): Tarefas a arquivar
+        """
+        if not tarefas:
+            return
+        with gzip.open(self.arquivo_tarefas, 'at', encoding='utf-8') as arquivo:
+            for tarefa in tarefas:
+                arquivo.write(json.dumps(tarefa.to_dict(), ensure_ascii=False))
+                arquivo.write("\n")
+        for tarefa in tarefas:
+            self._contagens["total"] += 1
+            por_prioridade = self._contagens["por_prioridade"]
+            por_prioridade[tarefa.prioridade] = por_prioridade.get(tarefa.prioridade, 0) + 1
+        with open(self.arquivo_contagens, 'w', encoding='utf-8') as arquivo:
+            json.dump(self._contagens, arquivo, ensure_ascii=False)
+
+    def buscar(self, id_tarefa):
+        """
+        Busca uma tarefa arquivada pelo ID, lendo o arquivo sob demanda.
+
+        Args:
+            id_tarefa (int): ID da tarefa
+
+        Returns:
+            Tarefa: Tarefa encontrada ou None
+        """
+        # to_dict começa pelo id, então só as linhas candidatas são decodificadas
+        prefixo = '{"id": %d,' % id_tarefa
+        for linha in self._linhas():
+            if linha.startswith(prefixo):
+                return Tarefa.from_dict(json.loads(linha), confiavel=True)
+        return None
+
+    def listar(self):
+        """
+        Percorre todas as tarefas arquivadas.
+
+        Returns:
+            generator: Tarefas arquivadas, na ordem de arquivamento
+        """
+        for linha in self._linhas():
+            yield Tarefa.from_dict(json.loads(linha), confiavel=True)
+
+    def _linhas(self):
+        """Lê o arquivo compactado linha a linha."""
+        if not os.path.exists(self.arquivo_tarefas):
+            return
+        with gzip.open(self.arquivo_tarefas, 'rt', encoding='utf-8') as arquivo:
+            for linha in arquivo:
+                yield linha
+
+    def contagens(self):
+        """
+        Retorna as contagens agregadas das tarefas arquivadas.
+
+        Returns:
+            dict: Total e contagem por prioridade
+        """
+        return {
+            "total": self._contagens["total"],
+            "por_prioridade": dict(self._contagens["por_prioridade"])
+        }
@@ -0,0 +1,89 @@
+"""
+Módulo que define o cache de consultas do gerenciador.
+Guarda resultados de consultas repetidas com política LRU.
+"""
+from collections import OrderedDict
+
+
+class CacheConsultas:
+    """
+    Cache LRU de resultados de consultas.
+
+    Atributos:
+        capacidade (int): Número máximo de entradas mantidas
+        acertos (int): Consultas atendidas pelo cache
+        falhas (int): Consultas que precisaram ser recalculadas
+    """
+
+    def __init__(self, capacidade=128):
+        """
+        Inicializa o cache.
+
+        Args:
+            capacidade (int): Número máximo de entradas (0 desativa o cache)
+        """
+        self.capacidade = capacidade
+        self.acertos = 0
+        self.falhas = 0
+        self._entradas = OrderedDict()
+
+    def obter(self, chave):
+        """
+        Busca um resultado no cache.
+
+        Args:
+            chave (tuple): Chave da consulta
+
+        Returns:
+            Resultado armazenado ou None se não estiver no cache
+        """
+        valor = self._entradas.get(chave)
+        if valor is None:
+            self.falhas += 1
+            return None
+        self._entradas.move_to_end(chave)
+        self.acertos += 1
+        return valor
+
+    def armazenar(self, chave, valor):
+        """
+        Armazena um resultado, descartando o menos usado se necessário.
+
+        Args:
+            chave (tuple): Chave da consulta
+            valor: Resultado imutável da consulta
+        """
+        if self.capacidade <= 0:
+            return
+        self._entradas[chave] = valor
+        self._entradas.move_to_end(chave)
+        while len(self._entradas) > self.capacidade:
+            self._entradas.popitem(last=False)
+
+    def invalidar(self, predicado):
+        """
+        Remove as entradas cujas chaves satisfazem o predicado.
+
+        Args:
+            predicado (callable): Função que recebe a chave e retorna bool
+        """
+        for chave in [c for c in self._entradas if predicado(c)]:
+            del self._entradas[chave]
+
+    def limpar(self):
+        """Remove todas as entradas do cache."""
+        self._entradas.clear()
+
+    def estatisticas(self):
+        """
+        Retorna estatísticas de uso do cache.
+
+        Returns:
+            dict: Acertos, falhas, tamanho atual e capacidade
+        """
+        return {
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "tamanho": len(self._entradas),
+            "capacidade": self.capacidade
+        }
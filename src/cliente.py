@@ -0,0 +1,121 @@
+"""
+Módulo do cliente do servidor de tarefas.
+Expõe os mesmos métodos do GerenciadorTarefas, executados no servidor.
+"""
+import socket
+import threading
+from itertools import count
+from src.gerenciador import LimiteWIPExcedido
+from src.servidor import METODOS, enviar_mensagem, receber_mensagem
+from src.tarefa import Tarefa
+
+ERROS = {
+    "LimiteWIPExcedido": LimiteWIPExcedido,
+    "ValueError": ValueError,
+    "TypeError": TypeError,
+    "KeyError": KeyError,
+}
+
+
+class ClienteTarefas:
+    """
+    Cliente leve para um ServidorTarefas.
+
+    Qualquer método listado em METODOS pode ser chamado como no
+    gerenciador, ex. cliente.criar_tarefa("Título", prioridade="Alta").
+    """
+
+    def __init__(self, caminho_socket):
+        """
+        Conecta ao servidor.
+
+        Args:
+            caminho_socket (str): Caminho do socket Unix do servidor
+        """
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(caminho_socket)
+        self._entrada = self._socket.makefile("rb")
+        self._saida = self._socket.makefile("wb")
+        self._ids = count(1)
+
+    def __getattr__(self, metodo):
+        if metodo not in METODOS:
+            raise AttributeError(metodo)
+        return lambda *args, **kwargs: self.em_lote([(metodo, args, kwargs)])[0]
+
+    def em_lote(self, chamadas):
+        """
+        Envia várias chamadas sem esperar a resposta de cada uma.
+
+        Args:
+            chamadas (list): Tuplas (metodo, args) ou (metodo, args, kwargs)
+
+        Returns:
+            list: Resultados na mesma ordem das chamadas
+
+        Raises:
+            Exception: O erro da primeira chamada que falhou
+        """
+        mensagens = []
+        for chamada in chamadas:
+            metodo, args = chamada[0], chamada[1]
+            kwargs = chamada[2] if len(chamada) > 2 else {}
+            mensagens.append({
+                "id": next(self._ids), "metodo": metodo, "args": list(args), "kwargs": kwargs
+            })
+
+        # O servidor responde enquanto lê: se o cliente só lesse depois de
+        # enviar tudo, as respostas encheriam o buffer do socket e os dois
+        # lados ficariam bloqueados escrevendo. Lotes são enviados por outra
+        # thread enquanto esta lê as respostas.
+        falhas_envio = []
+        envio = None
+        if len(mensagens) == 1:
+            self._enviar(mensagens, falhas_envio)
+        else:
+            envio = threading.Thread(target=self._enviar, args=(mensagens, falhas_envio))
+            envio.start()
+        respostas = []
+        for _ in mensagens:
+            resposta = receber_mensagem(self._entrada)
+            if resposta is None:
+                break
+            respostas.append(resposta)
+        if envio is not None:
+            envio.join()
+        if falhas_envio or len(respostas) < len(mensagens):
+            raise ConnectionError("Conexão com o servidor encerrada")
+        for resposta in respostas:
+            if not resposta["ok"]:
+                raise ERROS.get(resposta["erro"], RuntimeError)(*resposta["args"])
+        return [self._decodificar(r) for r in respostas]
+
+    def _enviar(self, mensagens, falhas):
+        """Escreve as mensagens no socket, anotando em falhas se a conexão cair."""
+        try:
+            for mensagem in mensagens:
+                enviar_mensagem(self._saida, mensagem)
+            self._saida.flush()
+        except OSError as e:
+            falhas.append(e)
+
+    @staticmethod
+    def _decodificar(resposta):
+        """Reconstrói as tarefas de uma resposta."""
+        if resposta["tipo"] == "tarefa":
+            return Tarefa.from_dict(resposta["resultado"], confiavel=True)
+        if resposta["tipo"] == "tarefas":
+            return [Tarefa.from_dict(d, confiavel=True) for d in resposta["resultado"]]
+        return resposta["resultado"]
+
+    def fechar(self):
+        """Encerra a conexão com o servidor."""
+        self._entrada.close()
+        self._saida.close()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
@@ -0,0 +1,118 @@
+"""
+Módulo de persistência compactada das tarefas.
+Grava e lê o arquivo de dados em blocos, sem montar o JSON inteiro em
+memória. O conteúdo descompactado é JSON Lines: a primeira linha traz o
+proximo_id e cada linha seguinte uma tarefa.
+"""
+import json
+import lzma
+import zlib
+
+CODECS = ("zlib", "lzma")
+TAMANHO_BLOCO = 64 * 1024
+
+# Cabeçalho xz e primeiro byte de um fluxo zlib com janela padrão.
+# Um arquivo JSON sem compressão sempre começa com "{" ou espaço.
+MAGICO_LZMA = b"\xfd7zXZ\x00"
+MAGICO_ZLIB = 0x78
+
+
+def detectar_codec(caminho):
+    """
+    Identifica a compressão de um arquivo pelos bytes iniciais.
+
+    Args:
+        caminho (str): Caminho do arquivo
+
+    Returns:
+        str: "zlib", "lzma" ou None se o arquivo não está compactado
+    """
+    with open(caminho, 'rb') as arquivo:
+        inicio = arquivo.read(len(MAGICO_LZMA))
+    if inicio.startswith(MAGICO_LZMA):
+        return "lzma"
+    if len(inicio) >= 2 and inicio[0] == MAGICO_ZLIB and int.from_bytes(inicio[:2], "big") % 31 == 0:
+        return "zlib"
+    return None
+
+
+def _compressor(codec):
+    if codec == "zlib":
+        return zlib.compressobj(6)
+    if codec == "lzma":
+        return lzma.LZMACompressor()
+    raise ValueError(f"Codec inválido: {codec}")
+
+
+def _descompressor(codec):
+    if codec == "zlib":
+        return zlib.decompressobj()
+    if codec == "lzma":
+        return lzma.LZMADecompressor()
+    raise ValueError(f"Codec inválido: {codec}")
+
+
+def gravar(caminho, proximo_id, tarefas, codec="zlib"):
+    """
+    Grava as tarefas compactadas, codificando-as em blocos.
+
+    Args:
+        caminho (str): Caminho do arquivo
+        proximo_id (int): Próximo ID disponível
+        tarefas (iterable): Tarefas a gravar
+        codec (str): "zlib" ou "lzma"
+    """
+    compressor = _compressor(codec)
+    with open(caminho, 'wb') as arquivo:
+        bloco = [json.dumps({"proximo_id": proximo_id})]
+        tamanho = 0
+        for tarefa in tarefas:
+            linha = json.dumps(tarefa.to_dict(), ensure_ascii=False)
+            bloco.append(linha)
+            tamanho += len(linha)
+            if tamanho >= TAMANHO_BLOCO:
+                arquivo.write(compressor.compress(("\n".join(bloco) + "\n").encode("utf-8")))
+                bloco = []
+                tamanho = 0
+        if bloco:
+            arquivo.write(compressor.compress(("\n".join(bloco) + "\n").encode("utf-8")))
+        arquivo.write(compressor.flush())
+
+
+def ler(caminho, codec=None):
+    """
+    Lê um arquivo compactado, descompactando-o em blocos.
+
+    Args:
+        caminho (str): Caminho do arquivo
+        codec (str): Codec do arquivo (detectado se omitido)
+
+    Returns:
+        tuple: (proximo_id, lista de dicionários de tarefas)
+
+    Raises:
+        ValueError: Se o codec é desconhecido ou o arquivo está truncado
+    """
+    descompressor = _descompressor(codec or detectar_codec(caminho))
+    proximo_id = 1
+    tarefas = []
+    resto = b""
+    primeira = True
+    with open(caminho, 'rb') as arquivo:
+        while True:
+            dados = arquivo.read(TAMANHO_BLOCO)
+            if not dados:
+                break
+            linhas = (resto + descompressor.decompress(dados)).split(b"\n")
+            resto = linhas.pop()
+            for linha in linhas:
+                if primeira:
+                    proximo_id = json.loads(linha)["proximo_id"]
+                    primeira = False
+                else:
+                    tarefas.append(json.loads(linha))
+    # Um arquivo cortado perderia tarefas em silêncio, e o próximo
+    # salvamento as apagaria de vez
+    if not descompressor.eof or resto or primeira:
+        raise ValueError(f"Arquivo compactado incompleto: {caminho}")
+    return proximo_id, tarefas
@@ -0,0 +1,283 @@
+"""
+Módulo do grafo de dependências entre tarefas.
+Mantém, para cada tarefa, a quantidade de dependências não resolvidas,
+atualizada incrementalmente a cada conclusão.
+"""
+from collections import defaultdict, deque
+
+
+class GrafoDependencias:
+    """
+    Grafo "bloqueada por" entre tarefas.
+
+    Uma dependência está resolvida quando a tarefa de que se depende foi
+    concluída ou não existe mais no quadro (deletada ou arquivada). Uma
+    tarefa está pronta quando não está concluída e não tem dependências
+    pendentes.
+    """
+
+    def __init__(self, tarefas=(), ao_alterar_prontidao=None):
+        """
+        Inicializa o grafo.
+
+        Args:
+            tarefas (iterable): Tarefas iniciais
+            ao_alterar_prontidao (callable): Chamada com a tarefa sempre que
+                ela entra ou sai do conjunto de prontas (fora de reconstruir)
+        """
+        self._ao_alterar_prontidao = ao_alterar_prontidao
+        self.reconstruir(tarefas)
+
+    def reconstruir(self, tarefas):
+        """
+        Reconstrói o grafo a partir de uma sequência de tarefas.
+
+        Args:
+            tarefas (iterable): Tarefas do quadro
+        """
+        self._tarefas = {t.id: t for t in tarefas}
+        self._dependentes = defaultdict(set)
+        self._pendencias = {}
+        self._prontas = {}
+        for tarefa in self._tarefas.values():
+            for id_dependencia in tarefa.dependencias:
+                self._dependentes[id_dependencia].add(tarefa.id)
+            self._recalcular(tarefa, notificar=False)
+
+    def _resolvida(self, id_tarefa):
+        """Indica se a dependência não bloqueia mais ninguém."""
+        tarefa = self._tarefas.get(id_tarefa)
+        return tarefa is None or tarefa.status == "Concluído"
+
+    def _recalcular(self, tarefa, notificar=True):
+        """Conta as dependências pendentes de uma tarefa."""
+        self._pendencias[tarefa.id] = sum(
+            1 for d in tarefa.dependencias if not self._resolvida(d)
+        )
+        self._atualizar_pronta(tarefa, notificar)
+
+    def _atualizar_pronta(self, tarefa, notificar=True):
+        """Inclui ou retira a tarefa do conjunto de prontas."""
+        estava_pronta = tarefa.id in self._prontas
+        if tarefa.status != "Concluído" and self._pendencias[tarefa.id] == 0:
+            self._prontas[tarefa.id] = tarefa
+        else:
+            self._prontas.pop(tarefa.id, None)
+        if (notificar and self._ao_alterar_prontidao is not None
+                and estava_pronta != (tarefa.id in self._prontas)):
+            self._ao_alterar_prontidao(tarefa)
+
+    def _propagar(self, id_tarefa, variacao):
+        """Soma a variação às pendências de quem depende da tarefa."""
+        for id_dependente in self._dependentes.get(id_tarefa, ()):
+            dependente = self._tarefas.get(id_dependente)
+            if dependente is not None:
+                self._pendencias[id_dependente] += variacao
+                self._atualizar_pronta(dependente)
+
+    def adicionar(self, tarefa):
+        """
+        Inclui uma tarefa criada ou restaurada.
+
+        Args:
+            tarefa (Tarefa): Tarefa incluída no quadro
+        """
+        self._tarefas[tarefa.id] = tarefa
+        for id_dependencia in tarefa.dependencias:
+            self._dependentes[id_dependencia].add(tarefa.id)
+        self._recalcular(tarefa)
+        if tarefa.status != "Concluído":
+            self._propagar(tarefa.id, +1)
+
+    def remover(self, tarefa):
+        """
+        Retira uma tarefa do grafo; quem dependia dela fica desbloqueado.
+
+        Args:
+            tarefa (Tarefa): Tarefa removida do quadro
+        """
+        if tarefa.status != "Concluído":
+            self._propagar(tarefa.id, -1)
+        for id_dependencia in tarefa.dependencias:
+            self._dependentes[id_dependencia].discard(tarefa.id)
+        self._tarefas.pop(tarefa.id, None)
+        self._pendencias.pop(tarefa.id, None)
+        self._prontas.pop(tarefa.id, None)
+
+    def status_alterado(self, tarefa, status_anterior):
+        """
+        Atualiza as pendências após uma mudança de status.
+
+        Args:
+            tarefa (Tarefa): Tarefa alterada
+            status_anterior (str): Status antes da alteração
+        """
+        concluida = tarefa.status == "Concluído"
+        if concluida != (status_anterior == "Concluído"):
+            self._propagar(tarefa.id, -1 if concluida else +1)
+        self._atualizar_pronta(tarefa)
+
+    def adicionar_dependencia(self, tarefa, dependencia):
+        """
+        Registra que a tarefa depende de outra.
+
+        Args:
+            tarefa (Tarefa): Tarefa bloqueada
+            dependencia (Tarefa): Tarefa que precisa ser concluída antes
+
+        Returns:
+            bool: False se a dependência já existia
+
+        Raises:
+            ValueError: Se a dependência criaria um ciclo
+        """
+        if dependencia.id in tarefa.dependencias:
+            return False
+        if self._alcanca(dependencia.id, tarefa.id):
+            raise ValueError(
+                f"Dependência {tarefa.id} -> {dependencia.id} criaria um ciclo"
+            )
+        tarefa.dependencias = tarefa.dependencias + [dependencia.id]
+        self._dependentes[dependencia.id].add(tarefa.id)
+        if not self._resolvida(dependencia.id):
+            self._pendencias[tarefa.id] += 1
+            self._atualizar_pronta(tarefa)
+        return True
+
+    def remover_dependencia(self, tarefa, id_dependencia):
+        """
+        Remove uma dependência da tarefa.
+
+        Args:
+            tarefa (Tarefa): Tarefa bloqueada
+            id_dependencia (int): ID da tarefa de que se dependia
+
+        Returns:
+            bool: False se a dependência não existia
+        """
+        if id_dependencia not in tarefa.dependencias:
+            return False
+        tarefa.dependencias = [d for d in tarefa.dependencias if d != id_dependencia]
+        self._dependentes[id_dependencia].discard(tarefa.id)
+        if not self._resolvida(id_dependencia):
+            self._pendencias[tarefa.id] -= 1
+            self._atualizar_pronta(tarefa)
+        return True
+
+    def substituir_dependencias(self, tarefa, dependencias):
+        """
+        Troca de uma vez todas as dependências da tarefa.
+
+        Usado ao desfazer ou refazer alterações, em que a lista inteira
+        volta a um estado anterior.
+
+        Args:
+            tarefa (Tarefa): Tarefa bloqueada
+            dependencias (list): Novos IDs das dependências
+
+        Raises:
+            ValueError: Se alguma dependência nova criaria um ciclo
+        """
+        for id_dependencia in dependencias:
+            if id_dependencia not in tarefa.dependencias and self._alcanca(id_dependencia, tarefa.id):
+                raise ValueError(
+                    f"Dependência {tarefa.id} -> {id_dependencia} criaria um ciclo"
+                )
+        for id_dependencia in tarefa.dependencias:
+            self._dependentes[id_dependencia].discard(tarefa.id)
+        tarefa.dependencias = list(dependencias)
+        for id_dependencia in tarefa.dependencias:
+            self._dependentes[id_dependencia].add(tarefa.id)
+        self._recalcular(tarefa)
+
+    def verificar_restauracao(self, tarefa):
+        """
+        Garante que incluir de volta uma tarefa removida não fecha um ciclo.
+
+        Enquanto a tarefa estava fora do quadro, outras tarefas podem ter
+        passado a depender, direta ou indiretamente, de suas dependências.
+
+        Args:
+            tarefa (Tarefa): Tarefa a restaurar
+
+        Raises:
+            ValueError: Se as dependências da tarefa criariam um ciclo
+        """
+        for id_dependencia in tarefa.dependencias:
+            if self._alcanca(id_dependencia, tarefa.id):
+                raise ValueError(
+                    f"Restaurar a tarefa {tarefa.id} criaria um ciclo de dependências"
+                )
+
+    def _alcanca(self, origem, destino):
+        """Indica se destino é alcançável a partir de origem pelas dependências."""
+        if origem == destino:
+            return True
+        visitados = {origem}
+        pilha = [origem]
+        while pilha:
+            tarefa = self._tarefas.get(pilha.pop())
+            if tarefa is None:
+                continue
+            for id_dependencia in tarefa.dependencias:
+                if id_dependencia == destino:
+                    return True
+                if id_dependencia not in visitados:
+                    visitados.add(id_dependencia)
+                    pilha.append(id_dependencia)
+        return False
+
+    def esta_pronta(self, id_tarefa):
+        """
+        Indica se a tarefa não está concluída nem tem dependências pendentes.
+
+        Args:
+            id_tarefa (int): ID da tarefa
+
+        Returns:
+            bool: True se a tarefa está pronta
+        """
+        return id_tarefa in self._prontas
+
+    def prontas(self):
+        """
+        Retorna as tarefas prontas para execução, em O(prontas).
+
+        Returns:
+            list: Tarefas não concluídas sem dependências pendentes
+        """
+        return list(self._prontas.values())
+
+    def caminho_critico(self):
+        """
+        Calcula a maior cadeia de tarefas pendentes em uma passada topológica.
+
+        Returns:
+            list: Tarefas da cadeia, da primeira a ser feita à última
+        """
+        pendencias = dict(self._pendencias)
+        distancia = {id_tarefa: 1 for id_tarefa in self._prontas}
+        anterior = {}
+        fila = deque(self._prontas)
+        ultimo = None
+        while fila:
+            id_tarefa = fila.popleft()
+            if ultimo is None or distancia[id_tarefa] > distancia[ultimo]:
+                ultimo = id_tarefa
+            for id_dependente in self._dependentes.get(id_tarefa, ()):
+                dependente = self._tarefas.get(id_dependente)
+                if dependente is None or dependente.status == "Concluído":
+                    continue
+                if distancia[id_tarefa] + 1 > distancia.get(id_dependente, 0):
+                    distancia[id_dependente] = distancia[id_tarefa] + 1
+                    anterior[id_dependente] = id_tarefa
+                pendencias[id_dependente] -= 1
+                if pendencias[id_dependente] == 0:
+                    fila.append(id_dependente)
+
+        caminho = []
+        while ultimo is not None:
+            caminho.append(self._tarefas[ultimo])
+            ultimo = anterior.get(ultimo)
+        caminho.reverse()
+        return caminho
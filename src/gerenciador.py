@@ -2,9 +2,48 @@
 Módulo principal do sistema de gerenciamento de tarefas.
 Implementa operações CRUD (Create, Read, Update, Delete).
 """
+import functools
 import json
 import os
-from src.tarefa import Tarefa
+import threading
+from collections import Counter, defaultdict, deque
+from datetime import datetime, timedelta
+from src import compressao as compressao_dados
+from src.agendador import Agendador
+from src.armazenamento_mmap import ArmazenamentoMmap
+from src.arquivamento import Arquivamento
+from src.cache import CacheConsultas
+from src.dependencias import GrafoDependencias
+from src.historico import CAMPOS_ALTERAVEIS, Historico
+from src.snapshot import QuadroVersionado, RegistroTarefa
+from src.tarefa import FORMATO_DATA, Tarefa, agora
+
+
+def _sincronizado(metodo):
+    """Executa o método com a trava do gerenciador."""
+    @functools.wraps(metodo)
+    def envolvido(self, *args, **kwargs):
+        with self._trava:
+            return metodo(self, *args, **kwargs)
+    return envolvido
+
+
+class LimiteWIPExcedido(ValueError):
+    """
+    Erro lançado quando uma operação ultrapassaria o limite WIP de uma coluna.
+    
+    Atributos:
+        coluna (str): Status (coluna do Kanban) que está cheio
+        limite (int): Limite WIP configurado para a coluna
+    """
+    
+    def __init__(self, coluna, limite):
+        self.coluna = coluna
+        self.limite = limite
+        super().__init__(
+            f'Limite WIP da coluna "{coluna}" atingido ({limite} tarefas)'
+        )
+
 
 class GerenciadorTarefas:
     """
@@ -14,18 +53,62 @@ class GerenciadorTarefas:
         tarefas (list): Lista de tarefas do sistema
         arquivo_dados (str): Caminho do arquivo de persistência
         proximo_id (int): Próximo ID disponível para nova tarefa
+        cache (CacheConsultas): Cache de resultados de consultas
+        quadro (QuadroVersionado): Versões imutáveis do quadro para leitores
+        arquivamento (Arquivamento): Arquivo morto de tarefas concluídas
+        historico (Historico): Log de operações para desfazer/refazer
+        armazenamento (ArmazenamentoMmap): Armazenamento em registros fixos,
+            ou None quando o formato é JSON
+        agendador (Agendador): Fila das tarefas "A Fazer" por prioridade
+        limites_wip (dict): Limite de tarefas por status (coluna)
+        grafo (GrafoDependencias): Dependências e tarefas prontas
+        compressao (str): Codec usado ao salvar em JSON ("zlib", "lzma")
+            ou None para JSON indentado
+    
+    Os métodos públicos são executados sob uma trava reentrante, então um
+    mesmo gerenciador pode ser usado por várias threads.
     """
     
-    def __init__(self, arquivo_dados="data/tarefas.json"):
+    FORMATOS = ("json", "mmap")
+    
+    def __init__(self, arquivo_dados="data/tarefas.json", tamanho_cache=128,
+                 intervalo_checkpoint=100, formato="json", limites_wip=None,
+                 compressao=None):
         """
         Inicializa o gerenciador de tarefas.
         
         Args:
-            arquivo_dados (str): Caminho do arquivo JSON para persistência
+            arquivo_dados (str): Caminho do arquivo de persistência
+            tamanho_cache (int): Máximo de consultas mantidas em cache
+            intervalo_checkpoint (int): Operações entre checkpoints do histórico
+            formato (str): "json" ou "mmap" (registros de tamanho fixo)
+            limites_wip (dict): Limite de tarefas por status, ex.
+                {"Em Progresso": 3}; colunas ausentes não têm limite
+            compressao (str): "zlib" ou "lzma" para salvar compactado; a
+                leitura detecta o formato do arquivo automaticamente
         """
+        if formato not in self.FORMATOS:
+            raise ValueError(f"Formato inválido: {formato}")
+        if compressao is not None and compressao not in compressao_dados.CODECS:
+            raise ValueError(f"Compressão inválida: {compressao}")
+        if compressao is not None and formato != "json":
+            raise ValueError("A compressão só se aplica ao formato JSON")
+        self.compressao = compressao
         self.tarefas = []
         self.arquivo_dados = arquivo_dados
+        self.armazenamento = ArmazenamentoMmap(arquivo_dados) if formato == "mmap" else None
         self.proximo_id = 1
+        self.cache = CacheConsultas(tamanho_cache)
+        self.quadro = QuadroVersionado()
+        self.agendador = Agendador(pronta=lambda id_tarefa: self.grafo.esta_pronta(id_tarefa))
+        self.grafo = GrafoDependencias(ao_alterar_prontidao=self.agendador.atualizar)
+        self._trava = threading.RLock()
+        self.limites_wip = dict(limites_wip or {})
+        self._tamanho_colunas = Counter()
+        self._fila_wip = defaultdict(deque)
+        self._processando_fila_wip = False
+        self.arquivamento = Arquivamento(arquivo_dados)
+        self.intervalo_checkpoint = intervalo_checkpoint
         self._criar_diretorio_dados()
         self.carregar_tarefas()
     
@@ -35,6 +118,119 @@ class GerenciadorTarefas:
         if diretorio and not os.path.exists(diretorio):
             os.makedirs(diretorio)
     
+    def _invalidar_cache(self, *pares):
+        """
+        Invalida apenas as consultas afetadas por uma alteração.
+        
+        Args:
+            pares (tuple): Pares (status, prioridade) alterados
+        """
+        def afetada(chave):
+            if chave[0] == "estatisticas":
+                return True
+            _, status, prioridade = chave
+            return any(
+                status in (None, s) and prioridade in (None, p)
+                for s, p in pares
+            )
+        self.cache.invalidar(afetada)
+    
+    @_sincronizado
+    def invalidar_cache(self):
+        """Descarta todo o cache (use após alterar tarefas diretamente)."""
+        self.cache.limpar()
+    
+    def _ao_criar(self, tarefa, posicao=None):
+        """Atualiza as estruturas derivadas após criar uma tarefa."""
+        self._invalidar_cache((tarefa.status, tarefa.prioridade))
+        if posicao is None:
+            self.quadro.anexar(tarefa)
+        else:
+            self.quadro.inserir(posicao, tarefa)
+        self.agendador.atualizar(tarefa)
+        self.grafo.adicionar(tarefa)
+        self._tamanho_colunas[tarefa.status] += 1
+    
+    def _ao_alterar(self, tarefa, status_anterior, prioridade_anterior):
+        """Atualiza as estruturas derivadas após alterar uma tarefa."""
+        self._invalidar_cache(
+            (status_anterior, prioridade_anterior),
+            (tarefa.status, tarefa.prioridade)
+        )
+        self.quadro.atualizar(tarefa)
+        self.agendador.atualizar(tarefa)
+        self.grafo.status_alterado(tarefa, status_anterior)
+        self._tamanho_colunas[status_anterior] -= 1
+        self._tamanho_colunas[tarefa.status] += 1
+    
+    def _ao_remover(self, tarefa):
+        """Atualiza as estruturas derivadas após remover uma tarefa."""
+        self._invalidar_cache((tarefa.status, tarefa.prioridade))
+        self.quadro.remover(tarefa.id)
+        self.agendador.remover(tarefa.id)
+        self.grafo.remover(tarefa)
+        self._tamanho_colunas[tarefa.status] -= 1
+    
+    def _verificar_wip(self, coluna, quantidade=1):
+        """
+        Garante que a coluna comporta mais tarefas, em O(1).
+        
+        Args:
+            coluna (str): Status de destino
+            quantidade (int): Quantidade de tarefas que entrarão na coluna
+        
+        Raises:
+            LimiteWIPExcedido: Se o limite da coluna seria ultrapassado
+        """
+        limite = self.limites_wip.get(coluna)
+        if limite is not None and self._tamanho_colunas[coluna] + quantidade > limite:
+            raise LimiteWIPExcedido(coluna, limite)
+    
+    def _processar_fila_wip(self):
+        """Aplica as transições enfileiradas cujas colunas liberaram espaço."""
+        if self._processando_fila_wip:
+            return
+        self._processando_fila_wip = True
+        try:
+            # Uma transição libera espaço na coluna de origem, que pode ter
+            # sido percorrida antes: repete até nenhuma fila avançar
+            avancou = True
+            while avancou:
+                avancou = False
+                for coluna, fila in list(self._fila_wip.items()):
+                    limite = self.limites_wip.get(coluna)
+                    while fila and (limite is None or self._tamanho_colunas[coluna] < limite):
+                        id_tarefa, status_origem = fila.popleft()
+                        avancou = True
+                        tarefa = self.buscar_tarefa(id_tarefa)
+                        # A tarefa pode ter mudado de coluna por outro caminho (ex. desfazer)
+                        if tarefa and tarefa.status == status_origem:
+                            self._alterar_status(tarefa, coluna)
+        finally:
+            self._processando_fila_wip = False
+    
+    @_sincronizado
+    def fila_wip(self):
+        """
+        Retorna as transições aguardando espaço em cada coluna.
+        
+        Returns:
+            dict: IDs das tarefas enfileiradas por status de destino
+        """
+        return {
+            coluna: [id_tarefa for id_tarefa, _ in fila]
+            for coluna, fila in self._fila_wip.items() if fila
+        }
+    
+    def _desenfileirar(self, id_tarefa):
+        """Descarta a transição enfileirada de uma tarefa, se houver."""
+        for fila in self._fila_wip.values():
+            for item in fila:
+                if item[0] == id_tarefa:
+                    fila.remove(item)
+                    return
+    
+    @_sincronizado
     def criar_tarefa(self, titulo, descricao="", prioridade="Média"):
         """
         Cria uma nova tarefa (CREATE).
@@ -49,13 +245,59 @@ class GerenciadorTarefas:
         """
         if not titulo or titulo.strip() == "":
             raise ValueError("O título da tarefa não pode ser vazio")
+        self._verificar_wip("A Fazer")
         
         tarefa = Tarefa(self.proximo_id, titulo, descricao, prioridade)
         self.tarefas.append(tarefa)
         self.proximo_id += 1
-        self.salvar_tarefas()
+        self._ao_criar(tarefa)
+        self.historico.registrar(
+            ("criar", tarefa.to_dict(), len(self.tarefas) - 1), self.tarefas
+        )
+        self._persistir("criar", tarefa)
         return tarefa
     
+    @_sincronizado
+    def criar_tarefas(self, itens):
+        """
+        Cria várias tarefas de uma vez, salvando o arquivo uma única vez.
+        
+        Args:
+            itens (list): Dicionários com "titulo" e, opcionalmente,
+                "descricao" e "prioridade"
+        
+        Returns:
+            list: Tarefas criadas
+        """
+        itens = list(itens)
+        for item in itens:
+            titulo = item.get("titulo")
+            if not titulo or titulo.strip() == "":
+                raise ValueError("O título da tarefa não pode ser vazio")
+        self._verificar_wip("A Fazer", len(itens))
+        
+        data_criacao = agora()
+        criadas = []
+        for item in itens:
+            tarefa = Tarefa(
+                self.proximo_id,
+                item["titulo"],
+                item.get("descricao", ""),
+                item.get("prioridade", "Média"),
+                data_criacao
+            )
+            self.tarefas.append(tarefa)
+            self.proximo_id += 1
+            self._ao_criar(tarefa)
+            self.historico.registrar(
+                ("criar", tarefa.to_dict(), len(self.tarefas) - 1), self.tarefas
+            )
+            criadas.append(tarefa)
+        if criadas:
+            self._persistir("criar", *criadas)
+        return criadas
+    
+    @_sincronizado
     def listar_tarefas(self, filtro_status=None, filtro_prioridade=None):
         """
         Lista todas as tarefas com filtros opcionais (READ).
@@ -65,8 +307,15 @@ class GerenciadorTarefas:
             filtro_prioridade (str): Filtrar por prioridade (opcional)
         
         Returns:
-            list: Lista de tarefas filtradas
+            tuple: Registros imutáveis (RegistroTarefa) das tarefas filtradas;
+                alterações feitas diretamente em objetos Tarefa só aparecem
+                após invalidar_cache()
         """
+        chave = ("listar", filtro_status or None, filtro_prioridade or None)
+        tarefas_filtradas = self.cache.obter(chave)
+        if tarefas_filtradas is not None:
+            return tarefas_filtradas
+        
         tarefas_filtradas = self.tarefas
         
         if filtro_status:
@@ -75,8 +324,23 @@ class GerenciadorTarefas:
         if filtro_prioridade:
             tarefas_filtradas = [t for t in tarefas_filtradas if t.prioridade == filtro_prioridade]
         
+        tarefas_filtradas = tuple(RegistroTarefa.de_tarefa(t) for t in tarefas_filtradas)
+        self.cache.armazenar(chave, tarefas_filtradas)
         return tarefas_filtradas
     
+    def snapshot(self):
+        """
+        Retorna uma visão imutável e versionada do quadro atual.
+        
+        A visão é obtida em O(1) e pode ser percorrida por outras threads
+        sem trava enquanto novas alterações são feitas.
+        
+        Returns:
+            Snapshot: Versão atual do quadro
+        """
+        return self.quadro.snapshot()
+    
+    @_sincronizado
     def buscar_tarefa(self, id_tarefa):
         """
         Busca uma tarefa pelo ID.
@@ -92,24 +356,132 @@ class GerenciadorTarefas:
                 return tarefa
         return None
     
-    def atualizar_status(self, id_tarefa, novo_status):
+    @_sincronizado
+    def atualizar_status(self, id_tarefa, novo_status, enfileirar=False):
         """
         Atualiza o status de uma tarefa (UPDATE).
         
         Args:
             id_tarefa (int): ID da tarefa
             novo_status (str): Novo status
+            enfileirar (bool): Se a coluna de destino estiver cheia, guarda a
+                transição para ser aplicada quando houver espaço
         
         Returns:
-            bool: True se atualizado com sucesso
+            bool: True se atualizado com sucesso (False se foi enfileirado)
+        
+        Raises:
+            LimiteWIPExcedido: Se a coluna de destino está cheia e
+                enfileirar é False
         """
         tarefa = self.buscar_tarefa(id_tarefa)
         if tarefa:
-            if tarefa.atualizar_status(novo_status):
-                self.salvar_tarefas()
-                return True
+            try:
+                return self._alterar_status(tarefa, novo_status)
+            except LimiteWIPExcedido:
+                if not enfileirar:
+                    raise
+                self._desenfileirar(tarefa.id)
+                self._fila_wip[novo_status].append((tarefa.id, tarefa.status))
         return False
     
+    @_sincronizado
+    def atualizar_status_em_lote(self, ids, novo_status):
+        """
+        Atualiza o status de várias tarefas, salvando o arquivo uma única vez.
+        
+        O limite WIP é verificado para o lote inteiro: ou todas as tarefas
+        são movidas, ou nenhuma.
+        
+        Args:
+            ids (list): IDs das tarefas
+            novo_status (str): Novo status
+        
+        Returns:
+            list: Tarefas atualizadas
+        
+        Raises:
+            LimiteWIPExcedido: Se o lote não cabe na coluna de destino
+        """
+        if novo_status not in Tarefa.STATUS_VALIDOS:
+            return []
+        ids = set(ids)
+        mover = [t for t in self.tarefas if t.id in ids and t.status != novo_status]
+        self._verificar_wip(novo_status, len(mover))
+        for tarefa in mover:
+            self._alterar_status(tarefa, novo_status, persistir=False)
+        if mover:
+            self._persistir("alterar", *mover)
+        return mover
+    
+    def _alterar_status(self, tarefa, novo_status, responsavel=None, persistir=True):
+        """
+        Altera o status de uma tarefa já localizada.
+        
+        Args:
+            tarefa (Tarefa): Tarefa a alterar
+            novo_status (str): Novo status
+            responsavel (str): Novo responsável (opcional)
+            persistir (bool): Se False, quem chama persiste a alteração
+        
+        Returns:
+            bool: True se atualizado com sucesso
+        
+        Raises:
+            LimiteWIPExcedido: Se a coluna de destino está cheia
+        """
+        if novo_status != tarefa.status:
+            self._verificar_wip(novo_status)
+        antes = self._campos_alteraveis(tarefa)
+        if not tarefa.atualizar_status(novo_status):
+            return False
+        if responsavel is not None:
+            tarefa.responsavel = responsavel
+        if tarefa.status != antes["status"]:
+            # A mudança explícita substitui a transição que estava na fila
+            self._desenfileirar(tarefa.id)
+        self._ao_alterar(tarefa, antes["status"], tarefa.prioridade)
+        self._registrar_alteracao(tarefa, antes)
+        if persistir:
+            self._persistir("alterar", tarefa)
+        self._processar_fila_wip()
+        return True
+    
+    @_sincronizado
+    def proxima_tarefa(self):
+        """
+        Retorna a tarefa "A Fazer" de maior prioridade e mais antiga entre
+        as que não têm dependências pendentes.
+        
+        Returns:
+            Tarefa: Próxima tarefa ou None se não houver pendentes
+        """
+        return self.agendador.proxima()
+    
+    @_sincronizado
+    def puxar_tarefa(self, responsavel):
+        """
+        Atribui a próxima tarefa a um responsável e a move para "Em Progresso".
+        
+        A operação é atômica: duas chamadas concorrentes nunca recebem a
+        mesma tarefa.
+        
+        Args:
+            responsavel (str): Quem está puxando a tarefa
+        
+        Returns:
+            Tarefa: Tarefa atribuída ou None se não houver pendentes
+        
+        Raises:
+            LimiteWIPExcedido: Se a coluna "Em Progresso" está cheia
+        """
+        tarefa = self.agendador.proxima()
+        if tarefa is None:
+            return None
+        self._alterar_status(tarefa, "Em Progresso", responsavel)
+        return tarefa
+    
+    @_sincronizado
     def atualizar_prioridade(self, id_tarefa, nova_prioridade):
         """
         Atualiza a prioridade de uma tarefa (UPDATE).
@@ -123,11 +495,86 @@ class GerenciadorTarefas:
         """
         tarefa = self.buscar_tarefa(id_tarefa)
         if tarefa:
+            antes = self._campos_alteraveis(tarefa)
             if tarefa.atualizar_prioridade(nova_prioridade):
-                self.salvar_tarefas()
+                self._ao_alterar(tarefa, tarefa.status, antes["prioridade"])
+                self._registrar_alteracao(tarefa, antes)
+                self._persistir("alterar", tarefa)
+                return True
+        return False
+    
+    @_sincronizado
+    def adicionar_dependencia(self, id_tarefa, id_dependencia):
+        """
+        Registra que uma tarefa só pode ser feita após outra.
+        
+        Args:
+            id_tarefa (int): ID da tarefa bloqueada
+            id_dependencia (int): ID da tarefa que precisa ser concluída antes
+        
+        Returns:
+            bool: True se a dependência foi adicionada
+        
+        Raises:
+            ValueError: Se a dependência criaria um ciclo
+        """
+        tarefa = self.buscar_tarefa(id_tarefa)
+        dependencia = self.buscar_tarefa(id_dependencia)
+        if tarefa and dependencia:
+            antes = self._campos_alteraveis(tarefa)
+            if self.grafo.adicionar_dependencia(tarefa, dependencia):
+                self._invalidar_cache((tarefa.status, tarefa.prioridade))
+                self.quadro.atualizar(tarefa)
+                self._registrar_alteracao(tarefa, antes)
+                self._persistir("alterar", tarefa)
                 return True
         return False
     
+    @_sincronizado
+    def remover_dependencia(self, id_tarefa, id_dependencia):
+        """
+        Remove a dependência entre duas tarefas.
+        
+        Args:
+            id_tarefa (int): ID da tarefa bloqueada
+            id_dependencia (int): ID da tarefa de que ela dependia
+        
+        Returns:
+            bool: True se a dependência foi removida
+        """
+        tarefa = self.buscar_tarefa(id_tarefa)
+        if tarefa is None:
+            return False
+        antes = self._campos_alteraveis(tarefa)
+        if self.grafo.remover_dependencia(tarefa, id_dependencia):
+            self._invalidar_cache((tarefa.status, tarefa.prioridade))
+            self.quadro.atualizar(tarefa)
+            self._registrar_alteracao(tarefa, antes)
+            self._persistir("alterar", tarefa)
+            return True
+        return False
+    
+    @_sincronizado
+    def listar_prontas(self):
+        """
+        Lista as tarefas não concluídas cujas dependências foram concluídas.
+        
+        Returns:
+            list: Tarefas prontas para execução
+        """
+        return self.grafo.prontas()
+    
+    @_sincronizado
+    def caminho_critico(self):
+        """
+        Retorna a maior cadeia de dependências entre tarefas não concluídas.
+        
+        Returns:
+            list: Tarefas da cadeia, na ordem em que devem ser feitas
+        """
+        return self.grafo.caminho_critico()
+    
+    @_sincronizado
     def deletar_tarefa(self, id_tarefa):
         """
         Deleta uma tarefa (DELETE).
@@ -140,13 +587,210 @@ class GerenciadorTarefas:
         """
         tarefa = self.buscar_tarefa(id_tarefa)
         if tarefa:
-            self.tarefas.remove(tarefa)
-            self.salvar_tarefas()
+            posicao = self.tarefas.index(tarefa)
+            del self.tarefas[posicao]
+            self._ao_remover(tarefa)
+            self.historico.registrar(
+                ("deletar", tarefa.to_dict(), posicao), self.tarefas
+            )
+            self._persistir("remover", tarefa)
+            self._processar_fila_wip()
             return True
         return False
     
+    def _campos_alteraveis(self, tarefa):
+        """Retorna os campos de uma tarefa que podem ser alterados."""
+        campos = {campo: getattr(tarefa, campo) for campo in CAMPOS_ALTERAVEIS}
+        # Cópia, para o delta não acompanhar mudanças futuras da lista
+        campos["dependencias"] = list(campos["dependencias"])
+        return campos
+    
+    def _registrar_alteracao(self, tarefa, antes):
+        """Registra no histórico a alteração de uma tarefa."""
+        self.historico.registrar(
+            ("alterar", tarefa.id, antes, self._campos_alteraveis(tarefa)),
+            self.tarefas
+        )
+    
+    def _aplicar_delta(self, delta):
+        """
+        Aplica um delta do histórico às tarefas em memória.
+        
+        Restaurar um estado anterior não passa pelos limites WIP nem pela
+        fila de transições, para não descartar o que pode ser refeito.
+        """
+        tipo = delta[0]
+        if tipo == "criar":
+            tarefa = Tarefa.from_dict(delta[1], confiavel=True)
+            self.grafo.verificar_restauracao(tarefa)
+            self.tarefas.insert(delta[2], tarefa)
+            self._ao_criar(tarefa, delta[2])
+            self._persistir("criar", tarefa)
+        elif tipo == "deletar":
+            tarefa = self.buscar_tarefa(delta[1]["id"])
+            self.tarefas.remove(tarefa)
+            self._ao_remover(tarefa)
+            self._persistir("remover", tarefa)
+        elif tipo == "alterar":
+            tarefa = self.buscar_tarefa(delta[1])
+            status_anterior, prioridade_anterior = tarefa.status, tarefa.prioridade
+            dependencias = delta[3].get("dependencias")
+            if dependencias is not None and dependencias != tarefa.dependencias:
+                # Valida antes de mexer nos demais campos
+                self.grafo.substituir_dependencias(tarefa, dependencias)
+            for campo, valor in delta[3].items():
+                if campo != "dependencias":
+                    setattr(tarefa, campo, valor)
+            self._ao_alterar(tarefa, status_anterior, prioridade_anterior)
+            self._persistir("alterar", tarefa)
+        self.historico.anotar(delta, self.tarefas)
+    
+    @_sincronizado
+    def desfazer(self):
+        """
+        Desfaz a última operação registrada.
+        
+        Returns:
+            bool: True se havia operação para desfazer
+        
+        Raises:
+            ValueError: Se desfazer restauraria uma tarefa fechando um ciclo
+                de dependências; o histórico não é alterado
+        """
+        delta = self.historico.desfazer()
+        if delta is None:
+            return False
+        try:
+            self._aplicar_delta(delta)
+        except ValueError:
+            self.historico.refazer()
+            raise
+        return True
+    
+    @_sincronizado
+    def refazer(self):
+        """
+        Refaz a última operação desfeita.
+        
+        Returns:
+            bool: True se havia operação para refazer
+        
+        Raises:
+            ValueError: Se refazer restauraria uma tarefa fechando um ciclo
+                de dependências; o histórico não é alterado
+        """
+        delta = self.historico.refazer()
+        if delta is None:
+            return False
+        try:
+            self._aplicar_delta(delta)
+        except ValueError:
+            self.historico.desfazer()
+            raise
+        return True
+    
+    @_sincronizado
+    def estado_em(self, momento):
+        """
+        Reconstrói as tarefas como estavam em um momento passado.
+        
+        Args:
+            momento (datetime | str): Momento desejado
+        
+        Returns:
+            list: Tarefas existentes no momento
+        """
+        return self.historico.estado_em(momento)
+    
+    @_sincronizado
+    def arquivar_concluidas(self, dias=30, agora=None):
+        """
+        Move para o arquivo morto as tarefas concluídas há mais de N dias.
+        
+        Args:
+            dias (int): Idade mínima da conclusão, em dias
+            agora (datetime): Momento de referência (padrão: agora)
+        
+        Returns:
+            int: Quantidade de tarefas arquivadas
+        """
+        limite = (agora or datetime.now()) - timedelta(days=dias)
+        limite = limite.strftime(FORMATO_DATA)
+        # O formato das datas permite comparar as strings diretamente
+        arquivar = [
+            t for t in self.tarefas
+            if t.status == "Concluído"
+            and t.data_conclusao is not None
+            and t.data_conclusao <= limite
+        ]
+        if not arquivar:
+            return 0
+        
+        self.arquivamento.anexar(arquivar)
+        ids = {t.id for t in arquivar}
+        self.tarefas = [t for t in self.tarefas if t.id not in ids]
+        for tarefa in arquivar:
+            self._ao_remover(tarefa)
+        self.historico.registrar(("arquivar", sorted(ids)), self.tarefas)
+        self.salvar_tarefas()
+        self._processar_fila_wip()
+        return len(arquivar)
+    
+    @_sincronizado
+    def buscar_arquivada(self, id_tarefa):
+        """
+        Busca uma tarefa no arquivo morto pelo ID.
+        
+        Args:
+            id_tarefa (int): ID da tarefa
+        
+        Returns:
+            Tarefa: Tarefa arquivada ou None
+        """
+        return self.arquivamento.buscar(id_tarefa)
+    
+    def _persistir(self, operacao, *tarefas):
+        """
+        Persiste uma operação sobre tarefas.
+        
+        No formato mmap a operação é gravada no próprio registro; no
+        formato JSON o arquivo inteiro é reescrito.
+        
+        Args:
+            operacao (str): "criar", "alterar" ou "remover"
+            tarefas (Tarefa): Tarefas afetadas
+        """
+        if self.armazenamento is None:
+            self.salvar_tarefas()
+            return
+        try:
+            for tarefa in tarefas:
+                if operacao == "criar":
+                    self.armazenamento.anexar(tarefa, self.proximo_id)
+                elif operacao == "alterar":
+                    self.armazenamento.atualizar(tarefa)
+                elif operacao == "remover":
+                    self.armazenamento.remover(tarefa.id)
+        except Exception as e:
+            print(f"Erro ao salvar tarefas: {e}")
+    
+    @_sincronizado
     def salvar_tarefas(self):
-        """Salva todas as tarefas no arquivo JSON."""
+        """Salva todas as tarefas no arquivo de dados."""
+        if self.armazenamento is not None:
+            try:
+                self.armazenamento.salvar(self.proximo_id, self.tarefas)
+            except Exception as e:
+                print(f"Erro ao salvar tarefas: {e}")
+            return
+        if self.compressao is not None:
+            try:
+                compressao_dados.gravar(
+                    self.arquivo_dados, self.proximo_id, self.tarefas, self.compressao
+                )
+            except Exception as e:
+                print(f"Erro ao salvar tarefas: {e}")
+            return
         try:
             with open(self.arquivo_dados, 'w', encoding='utf-8') as arquivo:
                 dados = {
@@ -157,25 +801,80 @@ class GerenciadorTarefas:
         except Exception as e:
             print(f"Erro ao salvar tarefas: {e}")
     
+    @_sincronizado
     def carregar_tarefas(self):
-        """Carrega as tarefas do arquivo JSON."""
-        if os.path.exists(self.arquivo_dados):
+        """Carrega as tarefas do arquivo de dados."""
+        self.cache.limpar()
+        if self.armazenamento is not None:
+            self._carregar_mmap()
+        elif os.path.exists(self.arquivo_dados):
             try:
-                with open(self.arquivo_dados, 'r', encoding='utf-8') as arquivo:
-                    dados = json.load(arquivo)
+                codec = compressao_dados.detectar_codec(self.arquivo_dados)
+                if codec is not None:
+                    self.proximo_id, registros = compressao_dados.ler(self.arquivo_dados, codec)
+                else:
+                    with open(self.arquivo_dados, 'r', encoding='utf-8') as arquivo:
+                        dados = json.load(arquivo)
                     self.proximo_id = dados.get("proximo_id", 1)
-                    self.tarefas = [Tarefa.from_dict(t) for t in dados.get("tarefas", [])]
+                    registros = dados.get("tarefas", [])
+                # O arquivo pode ter sido editado à mão: os registros são validados
+                self.tarefas = [Tarefa.from_dict(t) for t in registros]
             except Exception as e:
                 print(f"Erro ao carregar tarefas: {e}")
                 self.tarefas = []
+        self.quadro.reconstruir(self.tarefas)
+        self.grafo.reconstruir(self.tarefas)
+        self.agendador.reconstruir(self.tarefas)
+        self._tamanho_colunas = Counter(t.status for t in self.tarefas)
+        self.historico = Historico(self.tarefas, self.intervalo_checkpoint)
+    
+    @_sincronizado
+    def fechar(self):
+        """Libera o arquivo e o mapeamento abertos no formato mmap."""
+        if self.armazenamento is not None:
+            self.armazenamento.fechar()
     
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *excecao):
+        self.fechar()
+    
+    def _carregar_mmap(self):
+        """Carrega as tarefas do arquivo de registros, criando-o se necessário."""
+        try:
+            if self.armazenamento.existe():
+                self.proximo_id, self.tarefas = self.armazenamento.carregar()
+            else:
+                self.armazenamento.salvar(self.proximo_id, self.tarefas)
+        except Exception as e:
+            print(f"Erro ao carregar tarefas: {e}")
+            self.tarefas = []
+    
+    @_sincronizado
     def obter_estatisticas(self):
         """
         Retorna estatísticas sobre as tarefas.
         
+        As contagens por status e prioridade consideram apenas as tarefas
+        ativas; as tarefas arquivadas aparecem em "arquivadas".
+        
         Returns:
-            dict: Dicionário com estatísticas
+            dict: Dicionário com estatísticas (cópia independente do cache)
         """
+        estatisticas = self.cache.obter(("estatisticas",))
+        if estatisticas is None:
+            estatisticas = self._calcular_estatisticas()
+            self.cache.armazenar(("estatisticas",), estatisticas)
+        return {
+            "total": estatisticas["total"],
+            "por_status": dict(estatisticas["por_status"]),
+            "por_prioridade": dict(estatisticas["por_prioridade"]),
+            "arquivadas": self.arquivamento.contagens()
+        }
+    
+    def _calcular_estatisticas(self):
+        """Calcula as estatísticas percorrendo todas as tarefas."""
         total = len(self.tarefas)
         por_status = {
            "A Fazer": len([t for t in self.tarefas if t.status == "A Fazer"]),
@@ -193,13 +892,29 @@ class GerenciadorTarefas:
             "por_status": por_status,
             "por_prioridade": por_prioridade
         }
+    
+    @_sincronizado
+    def estatisticas_cache(self):
+        """
+        Retorna estatísticas de acertos e falhas do cache de consultas.
+        
+        Returns:
+            dict: Acertos, falhas, tamanho e capacidade do cache
+        """
+        return self.cache.estatisticas()
 
 
 # Exemplo de uso (para testar manualmente)
-if __name__ == "__main__":
+def demonstrar(arquivo_dados="data/tarefas.json"):
+    """
+    Executa a demonstração: cria tarefas de exemplo e mostra as estatísticas.
+    
+    Args:
+        arquivo_dados (str): Caminho do arquivo de persistência
+    """
     print("=== Sistema de Gerenciamento de Tarefas ===\n")
     
-    gerenciador = GerenciadorTarefas()
+    gerenciador = GerenciadorTarefas(arquivo_dados)
     
     # Criar algumas tarefas de exemplo
     t1 = gerenciador.criar_tarefa("Configurar ambiente", "Instalar Python e dependências", "Alta")
@@ -215,3 +930,9 @@ if __name__ == "__main__":
     print(f"Total de tarefas: {stats['total']}")
     print(f"Por status: {stats['por_status']}")
     print(f"Por prioridade: {stats['por_prioridade']}")
+
+
+if __name__ == "__main__":
+    # Sem argumentos roda a demonstração; veja --help para o modo de perfilamento
+    from src.perfilamento import main
+    main()
@@ -0,0 +1,188 @@
+"""
+Módulo de histórico de operações do gerenciador.
+Registra cada operação como um delta reversível, permitindo desfazer,
+refazer e reconstruir o estado do quadro em um momento passado.
+"""
+from bisect import bisect_right
+from collections import deque
+from datetime import datetime
+from src.tarefa import FORMATO_DATA, Tarefa
+
+CAMPOS_ALTERAVEIS = ("status", "prioridade", "data_conclusao", "responsavel", "dependencias")
+MAX_CHECKPOINTS = 10
+
+
+def inverter(delta):
+    """
+    Retorna o delta que desfaz o delta informado.
+
+    Args:
+        delta (tuple): Delta de criação, deleção ou alteração
+
+    Returns:
+        tuple: Delta inverso
+    """
+    tipo = delta[0]
+    if tipo == "criar":
+        return ("deletar",) + delta[1:]
+    if tipo == "deletar":
+        return ("criar",) + delta[1:]
+    if tipo == "alterar":
+        _, id_tarefa, antes, depois = delta
+        return ("alterar", id_tarefa, depois, antes)
+    raise ValueError(f"Operação não reversível: {tipo}")
+
+
+def aplicar(estado, delta):
+    """
+    Aplica um delta a um estado representado por dicionários.
+
+    Args:
+        estado (dict): Dicionários de tarefas indexados pelo ID
+        delta (tuple): Delta a aplicar
+    """
+    tipo = delta[0]
+    if tipo == "criar":
+        estado[delta[1]["id"]] = dict(delta[1])
+    elif tipo == "deletar":
+        estado.pop(delta[1]["id"], None)
+    elif tipo == "alterar":
+        estado[delta[1]].update(delta[3])
+    elif tipo == "arquivar":
+        for id_tarefa in delta[1]:
+            estado.pop(id_tarefa, None)
+
+
+class Historico:
+    """
+    Log de operações com pilhas de desfazer/refazer e checkpoints.
+
+    Apenas os últimos max_checkpoints checkpoints são mantidos, com as
+    operações posteriores ao mais antigo deles; a pilha de desfazer tem a
+    mesma profundidade. Assim a memória usada não cresce com o tempo de
+    vida do gerenciador.
+
+    Atributos:
+        intervalo_checkpoint (int): Operações entre checkpoints completos
+        max_checkpoints (int): Checkpoints mantidos
+    """
+
+    def __init__(self, tarefas, intervalo_checkpoint=100, max_checkpoints=MAX_CHECKPOINTS):
+        """
+        Inicializa o histórico com um checkpoint do estado atual.
+
+        Args:
+            tarefas (list): Tarefas no início do histórico
+            intervalo_checkpoint (int): Operações entre checkpoints
+            max_checkpoints (int): Checkpoints mantidos
+        """
+        self.intervalo_checkpoint = intervalo_checkpoint
+        self.max_checkpoints = max_checkpoints
+        self._operacoes = []
+        self._momentos_checkpoint = []
+        self._checkpoints = []
+        self._desfazer = deque(maxlen=intervalo_checkpoint * max_checkpoints)
+        self._refazer = []
+        self._criar_checkpoint(tarefas, datetime.now())
+
+    def _criar_checkpoint(self, tarefas, momento):
+        """Guarda uma cópia completa do estado a partir da operação atual."""
+        self._momentos_checkpoint.append(momento)
+        self._checkpoints.append((len(self._operacoes), [t.to_dict() for t in tarefas]))
+        if len(self._checkpoints) > self.max_checkpoints:
+            self._descartar_checkpoint()
+
+    def _descartar_checkpoint(self):
+        """Descarta o checkpoint mais antigo e as operações anteriores ao seguinte."""
+        del self._checkpoints[0]
+        del self._momentos_checkpoint[0]
+        descartadas = self._checkpoints[0][0]
+        del self._operacoes[:descartadas]
+        self._checkpoints = [
+            (inicio - descartadas, dados) for inicio, dados in self._checkpoints
+        ]
+
+    def anotar(self, delta, tarefas):
+        """
+        Acrescenta um delta já aplicado à linha do tempo.
+
+        Args:
+            delta (tuple): Delta aplicado
+            tarefas (list): Tarefas após a aplicação do delta
+        """
+        momento = datetime.now()
+        self._operacoes.append((momento, delta))
+        if len(self._operacoes) - self._checkpoints[-1][0] >= self.intervalo_checkpoint:
+            self._criar_checkpoint(tarefas, momento)
+
+    def registrar(self, delta, tarefas):
+        """
+        Registra uma nova operação do usuário.
+
+        Args:
+            delta (tuple): Delta aplicado
+            tarefas (list): Tarefas após a aplicação do delta
+        """
+        self.anotar(delta, tarefas)
+        if delta[0] == "arquivar":
+            # Arquivar não é reversível: funciona como barreira para desfazer
+            self._desfazer.clear()
+        else:
+            self._desfazer.append(delta)
+        self._refazer.clear()
+
+    def desfazer(self):
+        """
+        Retira a última operação da pilha de desfazer.
+
+        Returns:
+            tuple: Delta que desfaz a operação, ou None se não houver
+        """
+        if not self._desfazer:
+            return None
+        delta = self._desfazer.pop()
+        self._refazer.append(delta)
+        return inverter(delta)
+
+    def refazer(self):
+        """
+        Retira a última operação desfeita da pilha de refazer.
+
+        Returns:
+            tuple: Delta que refaz a operação, ou None se não houver
+        """
+        if not self._refazer:
+            return None
+        delta = self._refazer.pop()
+        self._desfazer.append(delta)
+        return delta
+
+    def estado_em(self, momento):
+        """
+        Reconstrói as tarefas em um momento passado.
+
+        Parte do último checkpoint anterior ao momento e reaplica apenas
+        os deltas registrados depois dele. Momentos anteriores ao checkpoint
+        mais antigo mantido não podem ser reconstruídos.
+
+        Args:
+            momento (datetime | str): Momento desejado; um texto em FORMATO_DATA
+                inclui todas as operações feitas naquele segundo
+
+        Returns:
+            list: Tarefas existentes no momento, ordenadas pelo ID
+        """
+        if isinstance(momento, str):
+            # O texto tem resolução de segundos: vale até o fim daquele segundo
+            momento = datetime.strptime(momento, FORMATO_DATA).replace(microsecond=999999)
+        indice = bisect_right(self._momentos_checkpoint, momento) - 1
+        if indice < 0:
+            raise ValueError("Momento anterior ao início do histórico mantido")
+
+        inicio, dados = self._checkpoints[indice]
+        estado = {d["id"]: dict(d) for d in dados}
+        for momento_op, delta in self._operacoes[inicio:]:
+            if momento_op > momento:
+                break
+            aplicar(estado, delta)
+        return [Tarefa.from_dict(estado[i], confiavel=True) for i in sorted(estado)]
@@ -0,0 +1,345 @@
+"""
+Módulo de perfilamento do gerenciador.
+Reproduz um trace de operações contra uma cópia do arquivo de dados e
+relata o custo de importação, o custo de inicialização, as latências por
+operação e, opcionalmente, os pontos quentes (cProfile) ou os picos de
+alocação (tracemalloc).
+
+Um trace é um arquivo JSON Lines com uma operação por linha, no mesmo
+formato das requisições do servidor:
+    {"metodo": "criar_tarefa", "args": ["Título"], "kwargs": {"prioridade": "Alta"}}
+
+Uso:
+    python -m src.gerenciador --arquivo data/tarefas.json --trace operacoes.jsonl
+    python -m src.gerenciador --sintetico 10000 --perfil cprofile
+"""
+import argparse
+import cProfile
+import io
+import json
+import os
+import pstats
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from src.gerenciador import GerenciadorTarefas, demonstrar
+from src.servidor import METODOS
+from src.tarefa import Tarefa
+
+PERFIS = ("nenhum", "cprofile", "tracemalloc")
+PERCENTIS = (50, 90, 99)
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def ler_trace(caminho):
+    """
+    Lê um trace de operações.
+
+    Args:
+        caminho (str): Arquivo JSON Lines com uma operação por linha
+
+    Returns:
+        list: Operações {"metodo", "args", "kwargs"}
+
+    Raises:
+        ValueError: Se alguma operação usa um método não suportado
+    """
+    operacoes = []
+    with open(caminho, 'r', encoding='utf-8') as arquivo:
+        for linha in arquivo:
+            if not linha.strip():
+                continue
+            operacao = json.loads(linha)
+            if operacao.get("metodo") not in METODOS:
+                raise ValueError(f"Método inválido no trace: {operacao.get('metodo')}")
+            operacoes.append(operacao)
+    return operacoes
+
+
+def salvar_trace(caminho, operacoes):
+    """
+    Grava um trace de operações em JSON Lines.
+
+    Args:
+        caminho (str): Arquivo de destino
+        operacoes (list): Operações {"metodo", "args", "kwargs"}
+    """
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        for operacao in operacoes:
+            arquivo.write(json.dumps(operacao, ensure_ascii=False) + "\n")
+
+
+def gerar_trace_sintetico(quantidade, primeiro_id=1, semente=42):
+    """
+    Gera um trace com uma mistura típica de leituras e escritas.
+
+    Args:
+        quantidade (int): Número de operações
+        primeiro_id (int): Próximo ID do quadro em que o trace será reproduzido
+        semente (int): Semente do gerador aleatório
+
+    Returns:
+        list: Operações {"metodo", "args", "kwargs"}
+    """
+    aleatorio = random.Random(semente)
+    proximo_id = primeiro_id
+    ids = list(range(1, primeiro_id))
+    pesos = {
+        "criar_tarefa": 30, "listar_tarefas": 20, "buscar_tarefa": 15,
+        "atualizar_status": 15, "atualizar_prioridade": 5,
+        "obter_estatisticas": 10, "deletar_tarefa": 5,
+    }
+    metodos, pesos = list(pesos), list(pesos.values())
+    operacoes = []
+    for _ in range(quantidade):
+        metodo = aleatorio.choices(metodos, pesos)[0] if ids else "criar_tarefa"
+        args, kwargs = [], {}
+        if metodo == "criar_tarefa":
+            args = [f"Tarefa {proximo_id}", "Descrição gerada para perfilamento"]
+            kwargs = {"prioridade": aleatorio.choice(Tarefa.PRIORIDADES_VALIDAS)}
+            ids.append(proximo_id)
+            proximo_id += 1
+        elif metodo == "listar_tarefas":
+            kwargs = {"filtro_status": aleatorio.choice(Tarefa.STATUS_VALIDOS + [None])}
+        elif metodo == "atualizar_status":
+            args = [aleatorio.choice(ids), aleatorio.choice(Tarefa.STATUS_VALIDOS)]
+        elif metodo == "atualizar_prioridade":
+            args = [aleatorio.choice(ids), aleatorio.choice(Tarefa.PRIORIDADES_VALIDAS)]
+        elif metodo == "buscar_tarefa":
+            args = [aleatorio.choice(ids)]
+        elif metodo == "deletar_tarefa":
+            args = [ids.pop(aleatorio.randrange(len(ids)))]
+        operacoes.append({"metodo": metodo, "args": args, "kwargs": kwargs})
+    return operacoes
+
+
+def percentis(amostras, niveis=PERCENTIS):
+    """
+    Calcula percentis pelo método do posto mais próximo.
+
+    Args:
+        amostras (list): Valores medidos
+        niveis (tuple): Percentis desejados (0-100)
+
+    Returns:
+        dict: Percentil -> valor
+    """
+    ordenadas = sorted(amostras)
+    return {
+        nivel: ordenadas[max(0, -(-nivel * len(ordenadas) // 100) - 1)]
+        for nivel in niveis
+    }
+
+
+def medir_importacao():
+    """
+    Mede o tempo de importação do gerenciador em um interpretador novo.
+
+    Returns:
+        float: Segundos gastos em "import src.gerenciador"
+    """
+    codigo = (
+        "import time; inicio = time.perf_counter(); import src.gerenciador; "
+        "print(time.perf_counter() - inicio)"
+    )
+    saida = subprocess.run(
+        [sys.executable, "-c", codigo], cwd=RAIZ, capture_output=True, text=True, check=True
+    )
+    return float(saida.stdout)
+
+
+def copiar_dados(arquivo_dados, diretorio):
+    """
+    Copia o arquivo de dados e seus arquivos auxiliares para um diretório.
+
+    Assim a reprodução do trace não altera o quadro original.
+
+    Args:
+        arquivo_dados (str): Caminho do arquivo de dados
+        diretorio (str): Diretório de destino
+
+    Returns:
+        str: Caminho da cópia do arquivo de dados
+    """
+    copia = os.path.join(diretorio, os.path.basename(arquivo_dados))
+    base = os.path.splitext(arquivo_dados)[0]
+    base_copia = os.path.splitext(copia)[0]
+    auxiliares = [
+        (arquivo_dados, copia),
+        (arquivo_dados + ".heap", copia + ".heap"),
+        (base + ".arquivo.jsonl.gz", base_copia + ".arquivo.jsonl.gz"),
+        (base + ".arquivo.json", base_copia + ".arquivo.json"),
+    ]
+    for origem, destino in auxiliares:
+        if os.path.exists(origem):
+            shutil.copyfile(origem, destino)
+    return copia
+
+
+def reproduzir(gerenciador, operacoes):
+    """
+    Executa as operações e mede a latência de cada uma.
+
+    Erros lançados pelo gerenciador (ex. limite WIP) são contados e a
+    reprodução continua.
+
+    Args:
+        gerenciador (GerenciadorTarefas): Gerenciador alvo
+        operacoes (list): Operações {"metodo", "args", "kwargs"}
+
+    Returns:
+        tuple: (latências em segundos por método, erros por método)
+    """
+    latencias = defaultdict(list)
+    erros = defaultdict(int)
+    relogio = time.perf_counter
+    for operacao in operacoes:
+        metodo = getattr(gerenciador, operacao["metodo"])
+        args, kwargs = operacao.get("args", []), operacao.get("kwargs", {})
+        inicio = relogio()
+        try:
+            metodo(*args, **kwargs)
+        except Exception:
+            erros[operacao["metodo"]] += 1
+        latencias[operacao["metodo"]].append(relogio() - inicio)
+    return dict(latencias), dict(erros)
+
+
+def executar(arquivo_dados, operacoes, perfil="nenhum", top=15, saida=None,
+             medir_import=True, **opcoes):
+    """
+    Reproduz um trace contra uma cópia do arquivo de dados e imprime o relatório.
+
+    Args:
+        arquivo_dados (str): Caminho do arquivo de dados
+        operacoes (list): Operações a reproduzir
+        perfil (str): "nenhum", "cprofile" ou "tracemalloc"
+        top (int): Quantidade de pontos quentes ou alocações listados
+        saida: Arquivo em que o relatório é impresso (padrão: stdout)
+        medir_import (bool): Se mede o tempo de importação em subprocesso
+        **opcoes: Argumentos repassados ao GerenciadorTarefas
+
+    Returns:
+        dict: Relatório com importacao, inicializacao, tarefas, latencias,
+            erros e, no modo tracemalloc, picos de memória em bytes
+
+    Raises:
+        ValueError: Se o perfil é inválido
+    """
+    if perfil not in PERFIS:
+        raise ValueError(f"Perfil inválido: {perfil}")
+    saida = saida or sys.stdout
+    relatorio = {"importacao": medir_importacao() if medir_import else None}
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        copia = copiar_dados(arquivo_dados, diretorio)
+        if perfil == "tracemalloc":
+            tracemalloc.start()
+
+        inicio = time.perf_counter()
+        gerenciador = GerenciadorTarefas(copia, **opcoes)
+        relatorio["inicializacao"] = time.perf_counter() - inicio
+        relatorio["tarefas"] = len(gerenciador.tarefas)
+
+        if perfil == "tracemalloc":
+            relatorio["pico_inicializacao"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.reset_peak()
+        perfilador = cProfile.Profile() if perfil == "cprofile" else None
+        if perfilador is not None:
+            perfilador.enable()
+        try:
+            relatorio["latencias"], relatorio["erros"] = reproduzir(gerenciador, operacoes)
+        finally:
+            if perfilador is not None:
+                perfilador.disable()
+        if perfil == "tracemalloc":
+            relatorio["pico_reproducao"] = tracemalloc.get_traced_memory()[1]
+            alocacoes = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(False, __file__)]
+            ).statistics("lineno")[:top]
+            tracemalloc.stop()
+        gerenciador.fechar()
+
+    _imprimir(relatorio, len(operacoes), saida)
+    if perfilador is not None:
+        print(f"\n=== Pontos quentes (top {top} por tempo próprio) ===", file=saida)
+        texto = io.StringIO()
+        pstats.Stats(perfilador, stream=texto).sort_stats("tottime").print_stats(top)
+        print(texto.getvalue().strip(), file=saida)
+    if perfil == "tracemalloc":
+        print("\n=== Memória ===", file=saida)
+        print(f"Pico na inicialização: {relatorio['pico_inicializacao'] / 1024:.1f} KiB", file=saida)
+        print(f"Pico na reprodução:    {relatorio['pico_reproducao'] / 1024:.1f} KiB", file=saida)
+        print(f"\nMaiores alocações vivas (top {top}):", file=saida)
+        for estatistica in alocacoes:
+            print(f"  {estatistica}", file=saida)
+    return relatorio
+
+
+def _imprimir(relatorio, quantidade, saida):
+    """Imprime os tempos de importação e inicialização e as latências."""
+    print("=== Inicialização ===", file=saida)
+    if relatorio["importacao"] is not None:
+        print(f"Importação:     {relatorio['importacao'] * 1000:9.2f} ms", file=saida)
+    print(
+        f"Inicialização:  {relatorio['inicializacao'] * 1000:9.2f} ms "
+        f"({relatorio['tarefas']} tarefas carregadas)",
+        file=saida,
+    )
+
+    print(f"\n=== Latência por operação ({quantidade} operações, µs) ===", file=saida)
+    cabecalho = "".join(f"{'p' + str(n):>10}" for n in PERCENTIS)
+    print(f"{'Operação':<28}{'chamadas':>9}{'erros':>7}{cabecalho}{'total ms':>11}", file=saida)
+    latencias = relatorio["latencias"]
+    for metodo in sorted(latencias, key=lambda m: -sum(latencias[m])):
+        amostras = latencias[metodo]
+        valores = "".join(f"{v * 1e6:10.1f}" for v in percentis(amostras).values())
+        print(
+            f"{metodo:<28}{len(amostras):>9}{relatorio['erros'].get(metodo, 0):>7}"
+            f"{valores}{sum(amostras) * 1000:11.2f}",
+            file=saida,
+        )
+
+
+def main(argv=None):
+    """Ponto de entrada de python -m src.gerenciador."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.gerenciador",
+        description="Perfila o gerenciador reproduzindo um trace de operações",
+    )
+    parser.add_argument("--arquivo", default="data/tarefas.json", help="Arquivo de dados")
+    parser.add_argument("--formato", default="json", choices=GerenciadorTarefas.FORMATOS)
+    parser.add_argument("--compressao", choices=("zlib", "lzma"), help="Codec ao salvar em JSON")
+    origem = parser.add_mutually_exclusive_group()
+    origem.add_argument("--trace", help="Trace JSON Lines gravado")
+    origem.add_argument("--sintetico", type=int, metavar="N", help="Gera um trace com N operações")
+    parser.add_argument("--salvar-trace", metavar="CAMINHO", help="Grava o trace sintético gerado")
+    parser.add_argument("--perfil", default="nenhum", choices=PERFIS)
+    parser.add_argument("--top", type=int, default=15, help="Itens listados pelo perfilador")
+    argumentos = parser.parse_args(argv)
+
+    if argumentos.trace is None and argumentos.sintetico is None:
+        demonstrar(argumentos.arquivo)
+        return
+
+    opcoes = {"formato": argumentos.formato, "compressao": argumentos.compressao}
+    if argumentos.trace is not None:
+        operacoes = ler_trace(argumentos.trace)
+    else:
+        # O trace sintético referencia IDs que já existem no quadro
+        with tempfile.TemporaryDirectory() as diretorio:
+            with GerenciadorTarefas(
+                copiar_dados(argumentos.arquivo, diretorio), **opcoes
+            ) as gerenciador:
+                primeiro_id = gerenciador.proximo_id
+        operacoes = gerar_trace_sintetico(argumentos.sintetico, primeiro_id)
+        if argumentos.salvar_trace:
+            salvar_trace(argumentos.salvar_trace, operacoes)
+
+    executar(argumentos.arquivo, operacoes, argumentos.perfil, argumentos.top, **opcoes)
@@ -0,0 +1,205 @@
+"""
+Módulo do servidor de tarefas.
+Carrega o gerenciador uma única vez e atende clientes por um socket Unix,
+com mensagens JSON compactas prefixadas pelo tamanho.
+
+Uso:
+    python -m src.servidor --arquivo data/tarefas.json --socket /tmp/tarefas.sock
+"""
+import argparse
+import json
+import os
+import socketserver
+import stat
+import struct
+import threading
+from src.gerenciador import GerenciadorTarefas, LimiteWIPExcedido
+from src.snapshot import RegistroTarefa
+from src.tarefa import Tarefa
+
+# Tamanho da mensagem em bytes, big-endian
+PREFIXO = struct.Struct(">I")
+
+METODOS = frozenset({
+    "criar_tarefa", "criar_tarefas", "listar_tarefas", "buscar_tarefa",
+    "atualizar_status", "atualizar_status_em_lote", "atualizar_prioridade",
+    "deletar_tarefa", "obter_estatisticas", "estatisticas_cache",
+    "proxima_tarefa", "puxar_tarefa", "adicionar_dependencia",
+    "remover_dependencia", "listar_prontas", "caminho_critico",
+    "desfazer", "refazer", "arquivar_concluidas", "buscar_arquivada",
+    "fila_wip",
+})
+
+
+def enviar_mensagem(saida, mensagem):
+    """
+    Escreve uma mensagem com prefixo de tamanho.
+
+    Args:
+        saida: Objeto com write (arquivo do socket)
+        mensagem (dict): Conteúdo serializável em JSON
+    """
+    corpo = json.dumps(mensagem, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    saida.write(PREFIXO.pack(len(corpo)) + corpo)
+
+
+def receber_mensagem(entrada):
+    """
+    Lê uma mensagem com prefixo de tamanho.
+
+    Args:
+        entrada: Objeto com read (arquivo do socket)
+
+    Returns:
+        dict: Mensagem recebida ou None se a conexão foi encerrada
+    """
+    cabecalho = entrada.read(PREFIXO.size)
+    if len(cabecalho) < PREFIXO.size:
+        return None
+    (tamanho,) = PREFIXO.unpack(cabecalho)
+    corpo = entrada.read(tamanho)
+    if len(corpo) < tamanho:
+        return None
+    return json.loads(corpo)
+
+
+def codificar_resultado(resultado):
+    """
+    Converte o retorno do gerenciador para JSON.
+
+    Returns:
+        tuple: (tipo, valor), onde tipo indica se há tarefas a reconstruir
+    """
+    if isinstance(resultado, (Tarefa, RegistroTarefa)):
+        return "tarefa", resultado.to_dict()
+    if (isinstance(resultado, (list, tuple)) and resultado
+            and isinstance(resultado[0], (Tarefa, RegistroTarefa))):
+        return "tarefas", [t.to_dict() for t in resultado]
+    if isinstance(resultado, tuple):
+        return None, list(resultado)
+    return None, resultado
+
+
+class _Atendimento(socketserver.StreamRequestHandler):
+    """Atende as requisições de uma conexão, na ordem em que chegam."""
+
+    def handle(self):
+        while True:
+            requisicao = receber_mensagem(self.rfile)
+            if requisicao is None:
+                return
+            enviar_mensagem(self.wfile, self.server.executar(requisicao))
+
+
+class ServidorTarefas(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Servidor que compartilha um único gerenciador entre vários clientes.
+
+    Cada conexão é atendida por uma thread, mas as chamadas ao gerenciador
+    são serializadas: há um único escritor e todos leem o mesmo estado.
+
+    Atributos:
+        gerenciador (GerenciadorTarefas): Gerenciador compartilhado
+        caminho_socket (str): Caminho do socket Unix
+    """
+
+    daemon_threads = True
+
+    def __init__(self, gerenciador, caminho_socket, arquivo_trace=None):
+        """
+        Inicializa o servidor e cria o socket.
+
+        Args:
+            gerenciador (GerenciadorTarefas): Gerenciador compartilhado
+            caminho_socket (str): Caminho do socket Unix
+            arquivo_trace (str): Se informado, grava cada chamada recebida
+                neste arquivo, para reprodução com python -m src.gerenciador
+
+        Raises:
+            ValueError: Se o caminho do socket existe e não é um socket
+        """
+        if os.path.lexists(caminho_socket):
+            # Só remove um socket antigo: um caminho errado não apaga dados
+            if not stat.S_ISSOCK(os.lstat(caminho_socket).st_mode):
+                raise ValueError(f"O caminho já existe e não é um socket: {caminho_socket}")
+            os.remove(caminho_socket)
+        self.gerenciador = gerenciador
+        self.caminho_socket = caminho_socket
+        self._trava = threading.Lock()
+        self._trace = open(arquivo_trace, 'a', encoding='utf-8') if arquivo_trace else None
+        super().__init__(caminho_socket, _Atendimento)
+
+    def server_bind(self):
+        super().server_bind()
+        # Restringe ao dono antes do listen: qualquer conexão executaria
+        # todos os métodos do gerenciador
+        os.chmod(self.caminho_socket, 0o600)
+
+    def executar(self, requisicao):
+        """
+        Executa uma requisição no gerenciador.
+
+        Args:
+            requisicao (dict): {"id", "metodo", "args", "kwargs"}
+
+        Returns:
+            dict: Resposta com o resultado ou com o erro ocorrido
+        """
+        resposta = {"id": requisicao.get("id")}
+        metodo = requisicao.get("metodo")
+        if metodo not in METODOS:
+            resposta.update(ok=False, erro="ValueError", args=[f"Método inválido: {metodo}"])
+            return resposta
+        try:
+            with self._trava:
+                if self._trace is not None:
+                    self._gravar_trace(requisicao)
+                resultado = getattr(self.gerenciador, metodo)(
+                    *requisicao.get("args", []), **requisicao.get("kwargs", {})
+                )
+            tipo, valor = codificar_resultado(resultado)
+            resposta.update(ok=True, tipo=tipo, resultado=valor)
+        except LimiteWIPExcedido as e:
+            resposta.update(ok=False, erro="LimiteWIPExcedido", args=[e.coluna, e.limite])
+        except Exception as e:
+            resposta.update(ok=False, erro=type(e).__name__, args=[str(a) for a in e.args])
+        return resposta
+
+    def _gravar_trace(self, requisicao):
+        """Acrescenta a chamada ao trace de operações."""
+        operacao = {
+            "metodo": requisicao["metodo"],
+            "args": requisicao.get("args", []),
+            "kwargs": requisicao.get("kwargs", {}),
+        }
+        self._trace.write(json.dumps(operacao, ensure_ascii=False) + "\n")
+        self._trace.flush()
+
+    def server_close(self):
+        super().server_close()
+        if self._trace is not None:
+            self._trace.close()
+        if os.path.exists(self.caminho_socket):
+            os.remove(self.caminho_socket)
+
+
+def main(argv=None):
+    """Inicia o servidor a partir da linha de comando."""
+    parser = argparse.ArgumentParser(description="Servidor de tarefas via socket Unix")
+    parser.add_argument("--arquivo", default="data/tarefas.json", help="Arquivo de dados")
+    parser.add_argument("--socket", default="data/tarefas.sock", help="Caminho do socket Unix")
+    parser.add_argument("--formato", default="json", choices=GerenciadorTarefas.FORMATOS)
+    parser.add_argument("--gravar-trace", metavar="CAMINHO", help="Grava as chamadas recebidas")
+    argumentos = parser.parse_args(argv)
+
+    with GerenciadorTarefas(argumentos.arquivo, formato=argumentos.formato) as gerenciador, \
+            ServidorTarefas(gerenciador, argumentos.socket, argumentos.gravar_trace) as servidor:
+        print(f"Servidor de tarefas ouvindo em {argumentos.socket}")
+        try:
+            servidor.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+Módulo de snapshots imutáveis do quadro de tarefas.
+Usa blocos compartilhados entre versões (copy-on-write) para que leitores
+percorram um quadro consistente sem travas e sem copiar a lista inteira.
+"""
+import threading
+from collections import namedtuple
+
+TAMANHO_BLOCO = 32
+
+
+class RegistroTarefa(namedtuple("RegistroTarefa", [
+        "id", "titulo", "descricao", "prioridade", "status",
+        "data_criacao", "data_conclusao", "responsavel", "dependencias"])):
+    """Cópia imutável do estado de uma tarefa."""
+
+    __slots__ = ()
+
+    @classmethod
+    def de_tarefa(cls, tarefa):
+        """
+        Cria um registro a partir de uma tarefa.
+
+        Args:
+            tarefa (Tarefa): Tarefa de origem
+
+        Returns:
+            RegistroTarefa: Registro com os valores atuais da tarefa
+        """
+        return cls(
+            tarefa.id, tarefa.titulo, tarefa.descricao, tarefa.prioridade,
+            tarefa.status, tarefa.data_criacao, tarefa.data_conclusao,
+            tarefa.responsavel, tuple(tarefa.dependencias)
+        )
+
+    def to_dict(self):
+        """Retorna o registro no formato de Tarefa.to_dict."""
+        dados = self._asdict()
+        dados["dependencias"] = list(self.dependencias)
+        return dados
+
+    def __str__(self):
+        return f"[{self.id}] {self.titulo} | {self.status} | Prioridade: {self.prioridade}"
+
+
+class Snapshot:
+    """
+    Visão somente leitura de uma versão do quadro.
+
+    Atributos:
+        versao (int): Número da versão representada
+    """
+
+    __slots__ = ("versao", "_blocos", "_tamanho")
+
+    def __init__(self, blocos, tamanho, versao):
+        self._blocos = blocos
+        self._tamanho = tamanho
+        self.versao = versao
+
+    def __iter__(self):
+        for bloco in self._blocos:
+            for registro in bloco:
+                if registro is not None:
+                    yield registro
+
+    def __len__(self):
+        return self._tamanho
+
+    def buscar(self, id_tarefa):
+        """
+        Busca um registro pelo ID nesta versão.
+
+        Args:
+            id_tarefa (int): ID da tarefa
+
+        Returns:
+            RegistroTarefa: Registro encontrado ou None
+        """
+        for registro in self:
+            if registro.id == id_tarefa:
+                return registro
+        return None
+
+    def listar(self, filtro_status=None, filtro_prioridade=None):
+        """
+        Lista os registros desta versão com filtros opcionais.
+
+        Args:
+            filtro_status (str): Filtrar por status (opcional)
+            filtro_prioridade (str): Filtrar por prioridade (opcional)
+
+        Returns:
+            tuple: Registros filtrados
+        """
+        return tuple(
+            r for r in self
+            if (not filtro_status or r.status == filtro_status)
+            and (not filtro_prioridade or r.prioridade == filtro_prioridade)
+        )
+
+
+class QuadroVersionado:
+    """
+    Vetor persistente de registros dividido em blocos de tamanho fixo.
+
+    Cada escrita copia apenas o bloco alterado e a tupla de blocos; as
+    demais partes são compartilhadas com as versões anteriores.
+
+    Atributos:
+        versao (int): Versão atual, incrementada a cada escrita
+    """
+
+    def __init__(self, tarefas=()):
+        """
+        Inicializa o quadro.
+
+        Args:
+            tarefas (iterable): Tarefas iniciais
+        """
+        self._trava = threading.Lock()
+        self.versao = 0
+        self.reconstruir(tarefas)
+
+    def reconstruir(self, tarefas):
+        """
+        Reconstrói o quadro a partir de uma sequência de tarefas.
+
+        Args:
+            tarefas (iterable): Tarefas na ordem do quadro
+        """
+        registros = [RegistroTarefa.de_tarefa(t) for t in tarefas]
+        with self._trava:
+            self._montar(registros)
+            self.versao += 1
+
+    def _montar(self, registros):
+        """Distribui os registros em blocos e refaz o índice de posições."""
+        self._blocos = tuple(
+            tuple(registros[i:i + TAMANHO_BLOCO])
+            for i in range(0, len(registros), TAMANHO_BLOCO)
+        )
+        self._posicoes = {
+            r.id: (i // TAMANHO_BLOCO, i % TAMANHO_BLOCO)
+            for i, r in enumerate(registros)
+        }
+        self._tamanho = len(registros)
+        self._removidos = 0
+
+    def _trocar_bloco(self, indice, bloco):
+        """Publica uma nova tupla de blocos com um bloco substituído."""
+        self._blocos = self._blocos[:indice] + (bloco,) + self._blocos[indice + 1:]
+
+    def anexar(self, tarefa):
+        """
+        Adiciona uma tarefa ao final do quadro.
+
+        Args:
+            tarefa (Tarefa): Tarefa criada
+        """
+        registro = RegistroTarefa.de_tarefa(tarefa)
+        with self._trava:
+            self._anexar(registro)
+            self.versao += 1
+
+    def _anexar(self, registro):
+        """Acrescenta um registro ao último bloco ou a um bloco novo."""
+        if self._blocos and len(self._blocos[-1]) < TAMANHO_BLOCO:
+            indice = len(self._blocos) - 1
+            self._posicoes[registro.id] = (indice, len(self._blocos[-1]))
+            self._trocar_bloco(indice, self._blocos[-1] + (registro,))
+        else:
+            self._posicoes[registro.id] = (len(self._blocos), 0)
+            self._blocos = self._blocos + ((registro,),)
+        self._tamanho += 1
+
+    def inserir(self, posicao, tarefa):
+        """
+        Insere uma tarefa antes da que ocupa a posição informada.
+
+        Ao desfazer uma deleção, a lacuna deixada pela remoção costuma
+        estar no ponto de inserção e é reaproveitada. Caso contrário só o
+        bloco afetado é copiado; se ele passar do dobro do tamanho, os
+        registros são redistribuídos.
+
+        Args:
+            posicao (int): Posição entre as tarefas do quadro
+            tarefa (Tarefa): Tarefa incluída
+        """
+        registro = RegistroTarefa.de_tarefa(tarefa)
+        with self._trava:
+            if posicao >= self._tamanho:
+                self._anexar(registro)
+                self.versao += 1
+                return
+            indice, deslocamento = self._localizar(posicao)
+            if deslocamento == 0 and indice > 0 and self._blocos[indice - 1][-1] is None:
+                indice -= 1
+                deslocamento = len(self._blocos[indice])
+            bloco = self._blocos[indice]
+            if deslocamento > 0 and bloco[deslocamento - 1] is None:
+                deslocamento -= 1
+                self._posicoes[registro.id] = (indice, deslocamento)
+                self._trocar_bloco(indice, bloco[:deslocamento] + (registro,) + bloco[deslocamento + 1:])
+                self._removidos -= 1
+                self._tamanho += 1
+            else:
+                bloco = bloco[:deslocamento] + (registro,) + bloco[deslocamento:]
+                if len(bloco) > 2 * TAMANHO_BLOCO:
+                    registros = [r for b in self._blocos for r in b if r is not None]
+                    registros.insert(posicao, registro)
+                    self._montar(registros)
+                else:
+                    self._trocar_bloco(indice, bloco)
+                    for i in range(deslocamento, len(bloco)):
+                        if bloco[i] is not None:
+                            self._posicoes[bloco[i].id] = (indice, i)
+                    self._tamanho += 1
+            self.versao += 1
+
+    def _localizar(self, posicao):
+        """Retorna (bloco, deslocamento) do registro vivo na posição informada."""
+        for indice, bloco in enumerate(self._blocos):
+            vivos = len(bloco) - bloco.count(None)
+            if posicao >= vivos:
+                posicao -= vivos
+                continue
+            for deslocamento, registro in enumerate(bloco):
+                if registro is not None:
+                    if posicao == 0:
+                        return indice, deslocamento
+                    posicao -= 1
+        raise IndexError(posicao)
+
+    def atualizar(self, tarefa):
+        """
+        Substitui o registro de uma tarefa alterada.
+
+        Args:
+            tarefa (Tarefa): Tarefa com os novos valores
+        """
+        with self._trava:
+            posicao = self._posicoes.get(tarefa.id)
+            if posicao is None:
+                return
+            indice, deslocamento = posicao
+            bloco = list(self._blocos[indice])
+            bloco[deslocamento] = RegistroTarefa.de_tarefa(tarefa)
+            self._trocar_bloco(indice, tuple(bloco))
+            self.versao += 1
+
+    def remover(self, id_tarefa):
+        """
+        Remove uma tarefa do quadro.
+
+        Args:
+            id_tarefa (int): ID da tarefa removida
+        """
+        with self._trava:
+            posicao = self._posicoes.pop(id_tarefa, None)
+            if posicao is None:
+                return
+            indice, deslocamento = posicao
+            bloco = list(self._blocos[indice])
+            bloco[deslocamento] = None
+            self._trocar_bloco(indice, tuple(bloco))
+            self._tamanho -= 1
+            self._removidos += 1
+            if self._removidos > self._tamanho:
+                self._montar([r for b in self._blocos for r in b if r is not None])
+            self.versao += 1
+
+    def snapshot(self):
+        """
+        Retorna a versão atual do quadro em O(1).
+
+        Returns:
+            Snapshot: Visão imutável da versão atual
+        """
+        with self._trava:
+            return Snapshot(self._blocos, self._tamanho, self.versao)
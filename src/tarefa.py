@@ -2,7 +2,32 @@
 Módulo que define a classe Tarefa.
 Representa uma tarefa individual no sistema de gerenciamento.
 """
-from datetime import datetime
+import time
+
+FORMATO_DATA = "%Y-%m-%d %H:%M:%S"
+
+# (segundo, texto) do último timestamp formatado, trocado em uma única
+# atribuição para que outra thread nunca veja um segundo com o texto de outro
+_ultimo_timestamp = (None, None)
+
+
+def agora():
+    """
+    Retorna o momento atual no formato FORMATO_DATA.
+
+    A formatação é reaproveitada enquanto o segundo não muda, o que evita
+    um strftime por tarefa em criações em lote.
+
+    Returns:
+        str: Data e hora atuais
+    """
+    global _ultimo_timestamp
+    segundo = int(time.time())
+    ultimo = _ultimo_timestamp
+    if segundo != ultimo[0]:
+        ultimo = (segundo, time.strftime(FORMATO_DATA, time.localtime(segundo)))
+        _ultimo_timestamp = ultimo
+    return ultimo[1]
 
 
 class Tarefa:
@@ -12,26 +37,38 @@ class Tarefa:
 
     PRIORIDADES_VALIDAS = ["Alta", "Média", "Baixa"]
     STATUS_VALIDOS = ["A Fazer", "Em Progresso", "Concluído"]
+    _PRIORIDADES = frozenset(PRIORIDADES_VALIDAS)
+    _STATUS = frozenset(STATUS_VALIDOS)
+    # Valores de campos opcionais usados pelo caminho rápido de from_dict
+    _PADROES = {
+        "descricao": "",
+        "prioridade": "Média",
+        "status": "A Fazer",
+        "data_conclusao": None,
+        "responsavel": None,
+    }
 
-    def __init__(self, id, titulo, descricao="", prioridade="Média"):
+    def __init__(self, id, titulo, descricao="", prioridade="Média", data_criacao=None):
         self.id = id
         self.titulo = titulo
         self.descricao = descricao
-        self.prioridade = prioridade if prioridade in self.PRIORIDADES_VALIDAS else "Média"
+        self.prioridade = prioridade if prioridade in self._PRIORIDADES else "Média"
         self.status = "A Fazer"
-        self.data_criacao = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.data_criacao = data_criacao or agora()
         self.data_conclusao = None
+        self.responsavel = None
+        self.dependencias = []
 
     def atualizar_status(self, novo_status):
-        if novo_status in self.STATUS_VALIDOS:
+        if novo_status in self._STATUS:
             self.status = novo_status
             if novo_status == "Concluído" and self.data_conclusao is None:
-                self.data_conclusao = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                self.data_conclusao = agora()
             return True
         return False
 
     def atualizar_prioridade(self, nova_prioridade):
-        if nova_prioridade in self.PRIORIDADES_VALIDAS:
+        if nova_prioridade in self._PRIORIDADES:
             self.prioridade = nova_prioridade
             return True
         return False
@@ -44,20 +81,46 @@ class Tarefa:
             "prioridade": self.prioridade,
             "status": self.status,
             "data_criacao": self.data_criacao,
-            "data_conclusao": self.data_conclusao
+            "data_conclusao": self.data_conclusao,
+            "responsavel": self.responsavel,
+            "dependencias": list(self.dependencias)
         }
 
     @classmethod
-    def from_dict(cls, dados):
+    def from_dict(cls, dados, confiavel=False):
+        """
+        Cria uma tarefa a partir de um dicionário.
+
+        Args:
+            dados (dict): Dicionário no formato de to_dict
+            confiavel (bool): Se True, os dados não são validados e os campos
+                ausentes recebem os valores padrão (caminho rápido para carga
+                em lote)
+
+        Returns:
+            Tarefa: Tarefa reconstruída
+        """
+        if confiavel:
+            tarefa = cls.__new__(cls)
+            # Campos podem faltar em arquivos de versões anteriores
+            tarefa.__dict__.update(cls._PADROES)
+            tarefa.__dict__.update(dados)
+            if "data_criacao" not in dados:
+                tarefa.data_criacao = agora()
+            tarefa.dependencias = list(dados.get("dependencias", ()))
+            return tarefa
         tarefa = cls(
             dados["id"],
             dados["titulo"],
             dados.get("descricao", ""),
-            dados.get("prioridade", "Média")
+            dados.get("prioridade", "Média"),
+            dados.get("data_criacao")
         )
-        tarefa.status = dados.get("status", "A Fazer")
-        tarefa.data_criacao = dados.get("data_criacao", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        status = dados.get("status", "A Fazer")
+        tarefa.status = status if status in cls._STATUS else "A Fazer"
         tarefa.data_conclusao = dados.get("data_conclusao")
+        tarefa.responsavel = dados.get("responsavel")
+        tarefa.dependencias = list(dados.get("dependencias", []))
         return tarefa
 
     def __str__(self):
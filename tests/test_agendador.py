@@ -0,0 +1,162 @@
+"""
+Testes unitários para o agendador de tarefas pendentes.
+"""
+import pytest
+import os
+import sys
+import threading
+
+# Adiciona o diretório src ao path para importar os módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.gerenciador import GerenciadorTarefas
+
+
+@pytest.fixture
+def gerenciador_limpo():
+    """Fixture que cria um gerenciador limpo usando arquivo temporário."""
+    arquivo_teste = "data/tarefas_teste_agendador.json"
+    if os.path.exists(arquivo_teste):
+        os.remove(arquivo_teste)
+    gerenciador = GerenciadorTarefas(arquivo_teste)
+    yield gerenciador
+    if os.path.exists(arquivo_teste):
+        os.remove(arquivo_teste)
+
+
+class TestProximaTarefa:
+    """Testes para a escolha da próxima tarefa."""
+
+    def test_sem_tarefas(self, gerenciador_limpo):
+        """Testa que não há próxima tarefa em um quadro vazio."""
+        assert gerenciador_limpo.proxima_tarefa() is None
+        assert gerenciador_limpo.puxar_tarefa("ana") is None
+
+    def test_prioridade_e_antiguidade(self, gerenciador_limpo):
+        """Testa que vence a maior prioridade e, nela, a mais antiga."""
+        gerenciador_limpo.criar_tarefa("Baixa", prioridade="Baixa")
+        gerenciador_limpo.criar_tarefa("Alta 1", prioridade="Alta")
+        gerenciador_limpo.criar_tarefa("Alta 2", prioridade="Alta")
+
+        assert gerenciador_limpo.proxima_tarefa().id == 2
+
+    def test_reage_a_mudancas(self, gerenciador_limpo):
+        """Testa que mudanças de status, prioridade e deleção são respeitadas."""
+        gerenciador_limpo.criar_tarefa("T1", prioridade="Alta")
+        gerenciador_limpo.criar_tarefa("T2", prioridade="Média")
+        gerenciador_limpo.criar_tarefa("T3", prioridade="Baixa")
+
+        gerenciador_limpo.atualizar_prioridade(1, "Baixa")
+        assert gerenciador_limpo.proxima_tarefa().id == 2
+
+        gerenciador_limpo.deletar_tarefa(2)
+        assert gerenciador_limpo.proxima_tarefa().id == 1
+
+        gerenciador_limpo.atualizar_status(1, "Em Progresso")
+        assert gerenciador_limpo.proxima_tarefa().id == 3
+
+        gerenciador_limpo.atualizar_status(1, "A Fazer")
+        assert gerenciador_limpo.proxima_tarefa().id == 1
+
+    def test_compacta_entradas_obsoletas(self, gerenciador_limpo):
+        """Testa que os heaps não acumulam entradas obsoletas."""
+        gerenciador_limpo.criar_tarefa("T1")
+        for i in range(500):
+            gerenciador_limpo.atualizar_prioridade(1, ("Alta", "Baixa")[i % 2])
+
+        agendador = gerenciador_limpo.agendador
+        entradas = sum(len(h) for h in agendador._heaps.values())
+        assert entradas <= agendador.MINIMO_COMPACTACAO + 1
+        assert gerenciador_limpo.proxima_tarefa().id == 1
+
+
+class TestPuxarTarefa:
+    """Testes para a atribuição de tarefas."""
+
+    def test_puxar_move_para_em_progresso(self, gerenciador_limpo):
+        """Testa que puxar atribui o responsável e muda o status."""
+        gerenciador_limpo.criar_tarefa("T1")
+
+        tarefa = gerenciador_limpo.puxar_tarefa("ana")
+
+        assert tarefa.id == 1
+        assert tarefa.status == "Em Progresso"
+        assert tarefa.responsavel == "ana"
+        assert gerenciador_limpo.proxima_tarefa() is None
+
+    def test_desfazer_puxada(self, gerenciador_limpo):
+        """Testa que desfazer devolve a tarefa para a fila."""
+        gerenciador_limpo.criar_tarefa("T1")
+        gerenciador_limpo.puxar_tarefa("ana")
+        gerenciador_limpo.desfazer()
+
+        tarefa = gerenciador_limpo.proxima_tarefa()
+        assert tarefa.id == 1
+        assert tarefa.responsavel is None
+
+    def test_ignora_tarefas_bloqueadas(self, gerenciador_limpo):
+        """Testa que tarefas com dependências pendentes não são puxadas."""
+        gerenciador_limpo.criar_tarefa("T1", prioridade="Baixa")
+        gerenciador_limpo.criar_tarefa("T2", prioridade="Alta")
+        gerenciador_limpo.adicionar_dependencia(2, 1)
+
+        assert gerenciador_limpo.puxar_tarefa("ana").id == 1
+        assert gerenciador_limpo.puxar_tarefa("bia") is None
+
+        gerenciador_limpo.atualizar_status(1, "Concluído")
+        assert gerenciador_limpo.puxar_tarefa("bia").id == 2
+
+    def test_puxadas_concorrentes(self, gerenciador_limpo):
+        """Testa que trabalhadores concorrentes nunca recebem a mesma tarefa."""
+        gerenciador_limpo.criar_tarefas([{"titulo": f"T{i}"} for i in range(40)])
+        puxadas = []
+
+        def trabalhador(nome):
+            while True:
+                tarefa = gerenciador_limpo.puxar_tarefa(nome)
+                if tarefa is None:
+                    return
+                puxadas.append(tarefa.id)
+
+        threads = [threading.Thread(target=trabalhador, args=(f"w{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(puxadas) == list(range(1, 41))
+
+    def test_criacoes_concorrentes(self, gerenciador_limpo):
+        """Testa que criações em threads diferentes não se intercalam."""
+        threads = [
+            threading.Thread(
+                target=lambda: [gerenciador_limpo.criar_tarefa("T") for _ in range(50)]
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(t.id for t in gerenciador_limpo.tarefas) == list(range(1, 201))
+        recarregado = GerenciadorTarefas(gerenciador_limpo.arquivo_dados)
+        assert len(recarregado.tarefas) == 200
+
+    def test_consultas_aguardam_a_trava(self, gerenciador_limpo):
+        """Testa que as consultas esperam a operação em andamento terminar."""
+        gerenciador_limpo.criar_tarefa("T1")
+        consultas = (
+            lambda: gerenciador_limpo.buscar_tarefa(1),
+            lambda: gerenciador_limpo.buscar_arquivada(1),
+            gerenciador_limpo.estatisticas_cache,
+        )
+        for consulta in consultas:
+            concluidas = []
+            with gerenciador_limpo._trava:
+                thread = threading.Thread(target=lambda: concluidas.append(consulta()))
+                thread.start()
+                thread.join(0.1)
+                assert concluidas == []
+            thread.join()
+            assert len(concluidas) == 1
@@ -0,0 +1,185 @@
+"""
+Testes unitários para o armazenamento em registros via mmap.
+"""
+import pytest
+import os
+import sys
+
+# Adiciona o diretório src ao path para importar os módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src import armazenamento_mmap
+from src.armazenamento_mmap import ArmazenamentoMmap, CAPACIDADE_INICIAL
+from src.gerenciador import GerenciadorTarefas
+
+ARQUIVO_TESTE = "data/tarefas_teste.trf"
+
+
+def _remover_arquivos():
+    """Remove os arquivos de registros e de textos."""
+    for caminho in (ARQUIVO_TESTE, ARQUIVO_TESTE + ".heap"):
+        if os.path.exists(caminho):
+            os.remove(caminho)
+
+
+@pytest.fixture
+def gerenciador_mmap():
+    """Fixture que cria um gerenciador no formato mmap."""
+    _remover_arquivos()
+    gerenciador = GerenciadorTarefas(ARQUIVO_TESTE, formato="mmap")
+    yield gerenciador
+    gerenciador.fechar()
+    _remover_arquivos()
+
+
+def _recarregar(gerenciador):
+    """Fecha o gerenciador e abre um novo no mesmo arquivo."""
+    gerenciador.fechar()
+    return GerenciadorTarefas(ARQUIVO_TESTE, formato="mmap")
+
+
+class TestArmazenamentoMmap:
+    """Testes para persistência no formato mmap."""
+
+    def test_criar_e_carregar(self, gerenciador_mmap):
+        """Testa que tarefas criadas são recuperadas com todos os campos."""
+        gerenciador_mmap.criar_tarefa("Título ç", "Descrição longa", "Alta")
+        gerenciador_mmap.criar_tarefa("Segunda")
+
+        gerenciador2 = _recarregar(gerenciador_mmap)
+        try:
+            assert [t.to_dict() for t in gerenciador2.tarefas] == \
+                [t.to_dict() for t in gerenciador_mmap.tarefas]
+            assert gerenciador2.proximo_id == 3
+        finally:
+            gerenciador2.fechar()
+
+    def test_atualizacao_no_lugar(self, gerenciador_mmap):
+        """Testa que mudar status e prioridade não altera o tamanho dos arquivos."""
+        gerenciador_mmap.criar_tarefa("T1")
+        tamanho = os.path.getsize(ARQUIVO_TESTE)
+        tamanho_heap = os.path.getsize(ARQUIVO_TESTE + ".heap")
+
+        gerenciador_mmap.atualizar_status(1, "Concluído")
+        gerenciador_mmap.atualizar_prioridade(1, "Baixa")
+
+        assert os.path.getsize(ARQUIVO_TESTE) == tamanho
+        assert os.path.getsize(ARQUIVO_TESTE + ".heap") == tamanho_heap
+        gerenciador2 = _recarregar(gerenciador_mmap)
+        try:
+            tarefa = gerenciador2.buscar_tarefa(1)
+            assert tarefa.status == "Concluído"
+            assert tarefa.prioridade == "Baixa"
+            assert tarefa.data_conclusao == gerenciador_mmap.buscar_tarefa(1).data_conclusao
+        finally:
+            gerenciador2.fechar()
+
+    def test_deletar_e_recriar(self, gerenciador_mmap):
+        """Testa remoção marcada no registro seguida de nova criação."""
+        for titulo in ("T1", "T2", "T3"):
+            gerenciador_mmap.criar_tarefa(titulo)
+        gerenciador_mmap.deletar_tarefa(2)
+
+        gerenciador2 = _recarregar(gerenciador_mmap)
+        try:
+            assert [t.id for t in gerenciador2.tarefas] == [1, 3]
+            gerenciador2.criar_tarefa("T4")
+        finally:
+            gerenciador2.fechar()
+
+        with GerenciadorTarefas(ARQUIVO_TESTE, formato="mmap") as gerenciador3:
+            assert [t.id for t in gerenciador3.tarefas] == [1, 3, 4]
+        assert gerenciador3.armazenamento._mapa is None
+
+    def test_crescimento_da_capacidade(self, gerenciador_mmap):
+        """Testa que o arquivo cresce além da capacidade inicial."""
+        gerenciador_mmap.criar_tarefas(
+            [{"titulo": f"T{i}"} for i in range(CAPACIDADE_INICIAL + 5)]
+        )
+
+        gerenciador2 = _recarregar(gerenciador_mmap)
+        try:
+            assert len(gerenciador2.tarefas) == CAPACIDADE_INICIAL + 5
+        finally:
+            gerenciador2.fechar()
+
+    def test_arquivo_invalido(self):
+        """Testa que um arquivo com cabeçalho errado é rejeitado."""
+        _remover_arquivos()
+        with open(ARQUIVO_TESTE, 'wb') as arquivo:
+            arquivo.write(b"x" * 64)
+        open(ARQUIVO_TESTE + ".heap", 'wb').close()
+        armazenamento = ArmazenamentoMmap(ARQUIVO_TESTE)
+        try:
+            with pytest.raises(ValueError):
+                armazenamento.carregar()
+        finally:
+            armazenamento.fechar()
+            _remover_arquivos()
+
+    def test_formato_invalido(self):
+        """Testa que formatos desconhecidos são rejeitados."""
+        with pytest.raises(ValueError):
+            GerenciadorTarefas(ARQUIVO_TESTE, formato="xml")
+
+    def test_responsavel_persistido(self, gerenciador_mmap):
+        """Testa que o responsável atribuído ao puxar a tarefa é gravado."""
+        gerenciador_mmap.criar_tarefa("T1")
+        gerenciador_mmap.puxar_tarefa("ana")
+
+        gerenciador2 = _recarregar(gerenciador_mmap)
+        try:
+            tarefa = gerenciador2.buscar_tarefa(1)
+            assert tarefa.responsavel == "ana"
+            assert tarefa.status == "Em Progresso"
+        finally:
+            gerenciador2.fechar()
+
+    def test_dependencias_persistidas(self, gerenciador_mmap):
+        """Testa que as dependências são gravadas no heap."""
+        gerenciador_mmap.criar_tarefas([{"titulo": "T1"}, {"titulo": "T2"}, {"titulo": "T3"}])
+        gerenciador_mmap.adicionar_dependencia(3, 1)
+        gerenciador_mmap.adicionar_dependencia(3, 2)
+
+        gerenciador2 = _recarregar(gerenciador_mmap)
+        try:
+            assert gerenciador2.buscar_tarefa(3).dependencias == [1, 2]
+            assert gerenciador2.buscar_tarefa(1).dependencias == []
+        finally:
+            gerenciador2.fechar()
+
+    def test_responsavel_nao_copia_descricao(self, gerenciador_mmap):
+        """Testa que mudar o responsável não regrava título e descrição."""
+        gerenciador_mmap.criar_tarefa("T1", "x" * 10_000)
+        tamanho_heap = os.path.getsize(ARQUIVO_TESTE + ".heap")
+
+        for i in range(50):
+            gerenciador_mmap.puxar_tarefa(f"pessoa{i}")
+            gerenciador_mmap.desfazer()
+
+        assert os.path.getsize(ARQUIVO_TESTE + ".heap") < tamanho_heap + 2_000
+        gerenciador_mmap.puxar_tarefa("ana")
+        gerenciador2 = _recarregar(gerenciador_mmap)
+        try:
+            tarefa = gerenciador2.buscar_tarefa(1)
+            assert tarefa.responsavel == "ana"
+            assert tarefa.descricao == "x" * 10_000
+        finally:
+            gerenciador2.fechar()
+
+    def test_compacta_heap_ao_carregar(self, gerenciador_mmap, monkeypatch):
+        """Testa que bytes mortos no heap são descartados ao carregar."""
+        monkeypatch.setattr(armazenamento_mmap, "LIMITE_COMPACTACAO", 1_000)
+        gerenciador_mmap.criar_tarefa("T1")
+        gerenciador_mmap.criar_tarefa("T2", "x" * 5_000)
+        gerenciador_mmap.deletar_tarefa(2)
+
+        gerenciador2 = _recarregar(gerenciador_mmap)
+        try:
+            assert os.path.getsize(ARQUIVO_TESTE + ".heap") < 100
+            assert [t.titulo for t in gerenciador2.tarefas] == ["T1"]
+            gerenciador2.criar_tarefa("T3")
+        finally:
+            gerenciador2.fechar()
+        with GerenciadorTarefas(ARQUIVO_TESTE, formato="mmap") as gerenciador3:
+            assert [t.id for t in gerenciador3.tarefas] == [1, 3]
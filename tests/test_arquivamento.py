@@ -0,0 +1,94 @@
+"""
+Testes unitários para o arquivamento de tarefas concluídas.
+"""
+import pytest
+import os
+import sys
+from datetime import datetime, timedelta
+
+# Adiciona o diretório src ao path para importar os módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.gerenciador import GerenciadorTarefas
+
+
+def _remover_arquivos(arquivo_teste):
+    """Remove o arquivo de dados e os arquivos do arquivo morto."""
+    base = os.path.splitext(arquivo_teste)[0]
+    for caminho in (arquivo_teste, base + ".arquivo.jsonl.gz", base + ".arquivo.json"):
+        if os.path.exists(caminho):
+            os.remove(caminho)
+
+
+@pytest.fixture
+def gerenciador_limpo():
+    """Fixture que cria um gerenciador limpo usando arquivo temporário."""
+    arquivo_teste = "data/tarefas_teste_arquivo.json"
+    _remover_arquivos(arquivo_teste)
+    gerenciador = GerenciadorTarefas(arquivo_teste)
+    yield gerenciador
+    _remover_arquivos(arquivo_teste)
+
+
+def _concluir_em(gerenciador, id_tarefa, momento):
+    """Conclui uma tarefa e ajusta a data de conclusão."""
+    gerenciador.atualizar_status(id_tarefa, "Concluído")
+    gerenciador.buscar_tarefa(id_tarefa).data_conclusao = momento.strftime("%Y-%m-%d %H:%M:%S")
+
+
+class TestArquivarConcluidas:
+    """Testes para o arquivamento pelo gerenciador."""
+
+    def test_arquiva_apenas_antigas(self, gerenciador_limpo):
+        """Testa que só tarefas concluídas há mais de N dias são arquivadas."""
+        agora = datetime(2024, 6, 30, 12, 0, 0)
+        gerenciador_limpo.criar_tarefa("Antiga", prioridade="Alta")
+        gerenciador_limpo.criar_tarefa("Recente")
+        gerenciador_limpo.criar_tarefa("Aberta")
+        _concluir_em(gerenciador_limpo, 1, agora - timedelta(days=40))
+        _concluir_em(gerenciador_limpo, 2, agora - timedelta(days=2))
+
+        arquivadas = gerenciador_limpo.arquivar_concluidas(dias=30, agora=agora)
+
+        assert arquivadas == 1
+        assert [t.id for t in gerenciador_limpo.listar_tarefas()] == [2, 3]
+        assert gerenciador_limpo.buscar_tarefa(1) is None
+
+    def test_busca_arquivada_por_id(self, gerenciador_limpo):
+        """Testa a busca sob demanda no arquivo morto."""
+        agora = datetime(2024, 6, 30)
+        for i in range(1, 12):
+            gerenciador_limpo.criar_tarefa(f"T{i}")
+            _concluir_em(gerenciador_limpo, i, agora - timedelta(days=60))
+        gerenciador_limpo.arquivar_concluidas(agora=agora)
+
+        tarefa = gerenciador_limpo.buscar_arquivada(11)
+        assert tarefa.titulo == "T11"
+        assert tarefa.status == "Concluído"
+        assert gerenciador_limpo.buscar_arquivada(1).titulo == "T1"
+        assert gerenciador_limpo.buscar_arquivada(99) is None
+
+    def test_contagens_persistidas(self, gerenciador_limpo):
+        """Testa que as contagens agregadas continuam disponíveis."""
+        agora = datetime(2024, 6, 30)
+        gerenciador_limpo.criar_tarefa("T1", prioridade="Alta")
+        gerenciador_limpo.criar_tarefa("T2", prioridade="Baixa")
+        _concluir_em(gerenciador_limpo, 1, agora - timedelta(days=60))
+        gerenciador_limpo.arquivar_concluidas(agora=agora)
+        _concluir_em(gerenciador_limpo, 2, agora - timedelta(days=60))
+        gerenciador_limpo.arquivar_concluidas(agora=agora)
+
+        gerenciador2 = GerenciadorTarefas(gerenciador_limpo.arquivo_dados)
+        stats = gerenciador2.obter_estatisticas()
+
+        assert stats["total"] == 0
+        assert stats["arquivadas"]["total"] == 2
+        assert stats["arquivadas"]["por_prioridade"]["Alta"] == 1
+        assert gerenciador2.buscar_arquivada(2).prioridade == "Baixa"
+
+    def test_nada_para_arquivar(self, gerenciador_limpo):
+        """Testa que nada é escrito quando não há tarefas elegíveis."""
+        gerenciador_limpo.criar_tarefa("T1")
+
+        assert gerenciador_limpo.arquivar_concluidas() == 0
+        assert not os.path.exists(gerenciador_limpo.arquivamento.arquivo_tarefas)
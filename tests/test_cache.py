@@ -0,0 +1,125 @@
+"""
+Testes unitários para o cache de consultas.
+Testa a política LRU e a invalidação feita pelo gerenciador.
+"""
+import pytest
+import os
+import sys
+
+# Adiciona o diretório src ao path para importar os módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.cache import CacheConsultas
+from src.gerenciador import GerenciadorTarefas
+
+
+@pytest.fixture
+def gerenciador_limpo():
+    """Fixture que cria um gerenciador limpo usando arquivo temporário."""
+    arquivo_teste = "data/tarefas_teste_cache.json"
+    if os.path.exists(arquivo_teste):
+        os.remove(arquivo_teste)
+    gerenciador = GerenciadorTarefas(arquivo_teste)
+    yield gerenciador
+    if os.path.exists(arquivo_teste):
+        os.remove(arquivo_teste)
+
+
+class TestCacheConsultas:
+    """Testes para a classe CacheConsultas."""
+
+    def test_acerto_e_falha(self):
+        """Testa contagem de acertos e falhas."""
+        cache = CacheConsultas(2)
+        assert cache.obter("a") is None
+        cache.armazenar("a", (1,))
+        assert cache.obter("a") == (1,)
+
+        stats = cache.estatisticas()
+        assert stats["acertos"] == 1
+        assert stats["falhas"] == 1
+        assert stats["tamanho"] == 1
+
+    def test_descarta_menos_usado(self):
+        """Testa que a entrada menos usada é descartada."""
+        cache = CacheConsultas(2)
+        cache.armazenar("a", 1)
+        cache.armazenar("b", 2)
+        cache.obter("a")
+        cache.armazenar("c", 3)
+
+        assert cache.obter("b") is None
+        assert cache.obter("a") == 1
+        assert cache.obter("c") == 3
+
+    def test_capacidade_zero_desativa(self):
+        """Testa que capacidade zero não armazena nada."""
+        cache = CacheConsultas(0)
+        cache.armazenar("a", 1)
+        assert cache.obter("a") is None
+
+
+class TestCacheGerenciador:
+    """Testes para o uso do cache pelo gerenciador."""
+
+    def test_consulta_repetida_usa_cache(self, gerenciador_limpo):
+        """Testa que a segunda consulta igual é um acerto."""
+        gerenciador_limpo.criar_tarefa("T1", prioridade="Alta")
+        primeira = gerenciador_limpo.listar_tarefas(filtro_status="A Fazer")
+        segunda = gerenciador_limpo.listar_tarefas(filtro_status="A Fazer")
+
+        assert primeira is segunda
+        assert gerenciador_limpo.estatisticas_cache()["acertos"] == 1
+
+    def test_resultado_imutavel(self, gerenciador_limpo):
+        """Testa que o resultado não expõe a lista interna."""
+        gerenciador_limpo.criar_tarefa("T1")
+        tarefas = gerenciador_limpo.listar_tarefas()
+
+        assert isinstance(tarefas, tuple)
+        stats = gerenciador_limpo.obter_estatisticas()
+        stats["por_status"]["A Fazer"] = 99
+        assert gerenciador_limpo.obter_estatisticas()["por_status"]["A Fazer"] == 1
+
+    def test_alteracao_direta_nao_corrompe_cache(self, gerenciador_limpo):
+        """Testa que mudar um objeto Tarefa não altera consultas em cache."""
+        gerenciador_limpo.criar_tarefa("T1")
+        gerenciador_limpo.listar_tarefas(filtro_status="A Fazer")
+
+        gerenciador_limpo.buscar_tarefa(1).atualizar_status("Concluído")
+
+        em_cache = gerenciador_limpo.listar_tarefas(filtro_status="A Fazer")
+        assert [t.status for t in em_cache] == ["A Fazer"]
+        with pytest.raises(AttributeError):
+            em_cache[0].status = "Concluído"
+
+        gerenciador_limpo.invalidar_cache()
+        assert gerenciador_limpo.listar_tarefas(filtro_status="A Fazer") == ()
+
+    def test_invalidacao_precisa(self, gerenciador_limpo):
+        """Testa que apenas as consultas afetadas são invalidadas."""
+        gerenciador_limpo.criar_tarefa("T1", prioridade="Alta")
+        gerenciador_limpo.criar_tarefa("T2", prioridade="Baixa")
+        baixa = gerenciador_limpo.listar_tarefas(filtro_prioridade="Baixa")
+        gerenciador_limpo.listar_tarefas(filtro_prioridade="Alta")
+
+        gerenciador_limpo.atualizar_status(1, "Em Progresso")
+
+        assert gerenciador_limpo.listar_tarefas(filtro_prioridade="Baixa") is baixa
+        alta = gerenciador_limpo.listar_tarefas(filtro_prioridade="Alta")
+        assert alta[0].status == "Em Progresso"
+
+    def test_mutacoes_invalidam(self, gerenciador_limpo):
+        """Testa que criar, atualizar e deletar refletem nas consultas."""
+        gerenciador_limpo.criar_tarefa("T1")
+        assert len(gerenciador_limpo.listar_tarefas(filtro_status="A Fazer")) == 1
+
+        gerenciador_limpo.criar_tarefa("T2")
+        assert len(gerenciador_limpo.listar_tarefas(filtro_status="A Fazer")) == 2
+
+        gerenciador_limpo.atualizar_prioridade(2, "Alta")
+        assert len(gerenciador_limpo.listar_tarefas(filtro_prioridade="Alta")) == 1
+
+        gerenciador_limpo.deletar_tarefa(1)
+        assert len(gerenciador_limpo.listar_tarefas()) == 1
+        assert gerenciador_limpo.obter_estatisticas()["total"] == 1
@@ -0,0 +1,126 @@
+"""
+Testes unitários para o formato compactado do arquivo de dados.
+"""
+import pytest
+import json
+import os
+import sys
+
+# Adiciona o diretório src ao path para importar os módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src import compressao
+from src.gerenciador import GerenciadorTarefas
+from src.tarefa import Tarefa
+
+ARQUIVO_TESTE = "data/tarefas_compactadas_teste.json"
+
+
+@pytest.fixture(autouse=True)
+def limpar_arquivo():
+    """Remove o arquivo de teste antes e depois de cada teste."""
+    if os.path.exists(ARQUIVO_TESTE):
+        os.remove(ARQUIVO_TESTE)
+    yield
+    if os.path.exists(ARQUIVO_TESTE):
+        os.remove(ARQUIVO_TESTE)
+
+
+class TestCompressao:
+    """Testes para a gravação e leitura em blocos."""
+
+    @pytest.mark.parametrize("codec", compressao.CODECS)
+    def test_gravar_e_ler(self, codec, monkeypatch):
+        """Testa a ida e volta com blocos menores que o conteúdo."""
+        monkeypatch.setattr(compressao, "TAMANHO_BLOCO", 64)
+        os.makedirs("data", exist_ok=True)
+        tarefas = [Tarefa(i, f"Tarefa {i}", "Descrição ç" * i) for i in range(1, 51)]
+
+        compressao.gravar(ARQUIVO_TESTE, 51, tarefas, codec)
+
+        assert compressao.detectar_codec(ARQUIVO_TESTE) == codec
+        proximo_id, registros = compressao.ler(ARQUIVO_TESTE)
+        assert proximo_id == 51
+        assert registros == [t.to_dict() for t in tarefas]
+
+    @pytest.mark.parametrize("codec", compressao.CODECS)
+    def test_arquivo_truncado(self, codec):
+        """Testa que um arquivo cortado é rejeitado, e não lido pela metade."""
+        os.makedirs("data", exist_ok=True)
+        tarefas = [Tarefa(i, f"Tarefa {i}", f"Descrição {i}") for i in range(1, 2001)]
+        compressao.gravar(ARQUIVO_TESTE, 2001, tarefas, codec)
+        with open(ARQUIVO_TESTE, 'rb') as arquivo:
+            dados = arquivo.read()
+        with open(ARQUIVO_TESTE, 'wb') as arquivo:
+            arquivo.write(dados[:len(dados) // 2])
+
+        with pytest.raises(ValueError):
+            compressao.ler(ARQUIVO_TESTE)
+
+    def test_codec_desconhecido(self):
+        """Testa que um codec desconhecido não é lido como lzma."""
+        os.makedirs("data", exist_ok=True)
+        with open(ARQUIVO_TESTE, 'wb') as arquivo:
+            arquivo.write(b"{}")
+
+        with pytest.raises(ValueError):
+            compressao.ler(ARQUIVO_TESTE, "bz2")
+        with pytest.raises(ValueError):
+            compressao.ler(ARQUIVO_TESTE)
+
+    def test_json_nao_e_detectado(self):
+        """Testa que um arquivo JSON comum não é tomado por compactado."""
+        os.makedirs("data", exist_ok=True)
+        with open(ARQUIVO_TESTE, 'w', encoding='utf-8') as arquivo:
+            json.dump({"proximo_id": 1, "tarefas": []}, arquivo, indent=4)
+
+        assert compressao.detectar_codec(ARQUIVO_TESTE) is None
+
+
+class TestGerenciadorCompactado:
+    """Testes para o gerenciador com compressão."""
+
+    @pytest.mark.parametrize("codec", compressao.CODECS)
+    def test_carregar_detecta_formato(self, codec):
+        """Testa que um gerenciador sem compressão lê o arquivo compactado."""
+        gerenciador = GerenciadorTarefas(ARQUIVO_TESTE, compressao=codec)
+        gerenciador.criar_tarefa("T1", "Desc", "Alta")
+        gerenciador.criar_tarefa("T2")
+        gerenciador.atualizar_status(2, "Concluído")
+
+        recarregado = GerenciadorTarefas(ARQUIVO_TESTE)
+        assert recarregado.proximo_id == 3
+        assert [t.to_dict() for t in recarregado.tarefas] == [
+            t.to_dict() for t in gerenciador.tarefas
+        ]
+
+    def test_carregar_truncado_informa_erro(self, capsys):
+        """Testa que o gerenciador informa a falha ao ler um arquivo cortado."""
+        gerenciador = GerenciadorTarefas(ARQUIVO_TESTE, compressao="zlib")
+        gerenciador.criar_tarefas([{"titulo": f"T{i}"} for i in range(200)])
+        with open(ARQUIVO_TESTE, 'rb') as arquivo:
+            dados = arquivo.read()
+        with open(ARQUIVO_TESTE, 'wb') as arquivo:
+            arquivo.write(dados[:len(dados) // 2])
+
+        GerenciadorTarefas(ARQUIVO_TESTE)
+
+        assert "Erro ao carregar tarefas" in capsys.readouterr().out
+
+    def test_migrar_para_json(self):
+        """Testa que salvar sem compressão regrava o JSON indentado."""
+        gerenciador = GerenciadorTarefas(ARQUIVO_TESTE, compressao="zlib")
+        gerenciador.criar_tarefa("T1")
+
+        sem_compressao = GerenciadorTarefas(ARQUIVO_TESTE)
+        sem_compressao.salvar_tarefas()
+
+        with open(ARQUIVO_TESTE, 'r', encoding='utf-8') as arquivo:
+            assert json.load(arquivo)["tarefas"][0]["titulo"] == "T1"
+
+    def test_compressao_invalida(self):
+        """Testa os valores de compressão não suportados."""
+        with pytest.raises(ValueError):
+            GerenciadorTarefas(ARQUIVO_TESTE, compressao="bz2")
+        with pytest.raises(ValueError):
+            GerenciadorTarefas(ARQUIVO_TESTE, formato="mmap", compressao="zlib")
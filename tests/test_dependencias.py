@@ -0,0 +1,176 @@
+"""
+Testes unitários para o grafo de dependências entre tarefas.
+"""
+import pytest
+import os
+import sys
+
+# Adiciona o diretório src ao path para importar os módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.gerenciador import GerenciadorTarefas
+from src.tarefa import Tarefa
+
+
+@pytest.fixture
+def gerenciador_limpo():
+    """Fixture que cria um gerenciador com quatro tarefas."""
+    arquivo_teste = "data/tarefas_teste_dependencias.json"
+    if os.path.exists(arquivo_teste):
+        os.remove(arquivo_teste)
+    gerenciador = GerenciadorTarefas(arquivo_teste)
+    gerenciador.criar_tarefas([{"titulo": f"T{i}"} for i in range(1, 5)])
+    yield gerenciador
+    if os.path.exists(arquivo_teste):
+        os.remove(arquivo_teste)
+
+
+def _ids(tarefas):
+    return sorted(t.id for t in tarefas)
+
+
+class TestDependencias:
+    """Testes para inclusão e remoção de dependências."""
+
+    def test_dependencia_bloqueia(self, gerenciador_limpo):
+        """Testa que tarefas com dependências pendentes não ficam prontas."""
+        gerenciador_limpo.adicionar_dependencia(2, 1)
+
+        assert _ids(gerenciador_limpo.listar_prontas()) == [1, 3, 4]
+
+    def test_conclusao_libera_dependentes(self, gerenciador_limpo):
+        """Testa que concluir a dependência deixa o dependente pronto."""
+        gerenciador_limpo.adicionar_dependencia(3, 1)
+        gerenciador_limpo.adicionar_dependencia(3, 2)
+
+        gerenciador_limpo.atualizar_status(1, "Concluído")
+        assert 3 not in _ids(gerenciador_limpo.listar_prontas())
+
+        gerenciador_limpo.atualizar_status(2, "Concluído")
+        assert _ids(gerenciador_limpo.listar_prontas()) == [3, 4]
+
+        gerenciador_limpo.atualizar_status(2, "Em Progresso")
+        assert _ids(gerenciador_limpo.listar_prontas()) == [2, 4]
+
+    def test_ciclo_rejeitado(self, gerenciador_limpo):
+        """Testa que dependências circulares são rejeitadas."""
+        gerenciador_limpo.adicionar_dependencia(2, 1)
+        gerenciador_limpo.adicionar_dependencia(3, 2)
+
+        with pytest.raises(ValueError):
+            gerenciador_limpo.adicionar_dependencia(1, 3)
+        with pytest.raises(ValueError):
+            gerenciador_limpo.adicionar_dependencia(1, 1)
+        assert gerenciador_limpo.buscar_tarefa(1).dependencias == []
+
+    def test_remover_dependencia(self, gerenciador_limpo):
+        """Testa que remover a dependência desbloqueia a tarefa."""
+        gerenciador_limpo.adicionar_dependencia(2, 1)
+
+        assert gerenciador_limpo.remover_dependencia(2, 1) is True
+        assert gerenciador_limpo.remover_dependencia(2, 1) is False
+        assert 2 in _ids(gerenciador_limpo.listar_prontas())
+
+    def test_deletar_dependencia_e_desfazer(self, gerenciador_limpo):
+        """Testa que deletar a dependência libera e desfazer volta a bloquear."""
+        gerenciador_limpo.adicionar_dependencia(2, 1)
+        gerenciador_limpo.deletar_tarefa(1)
+        assert 2 in _ids(gerenciador_limpo.listar_prontas())
+
+        gerenciador_limpo.desfazer()
+        assert 2 not in _ids(gerenciador_limpo.listar_prontas())
+
+    def test_desfazer_dependencia_antes_da_delecao(self, gerenciador_limpo):
+        """Testa que a dependência criada após uma deleção é desfeita primeiro."""
+        gerenciador_limpo.adicionar_dependencia(1, 2)
+        gerenciador_limpo.adicionar_dependencia(2, 3)
+        gerenciador_limpo.deletar_tarefa(2)
+        assert gerenciador_limpo.adicionar_dependencia(3, 1) is True
+
+        assert gerenciador_limpo.desfazer() is True
+        assert gerenciador_limpo.buscar_tarefa(3).dependencias == []
+        assert gerenciador_limpo.buscar_tarefa(2) is None
+
+        assert gerenciador_limpo.desfazer() is True
+        assert gerenciador_limpo.buscar_tarefa(2).dependencias == [3]
+        assert _ids(gerenciador_limpo.listar_prontas()) == [3, 4]
+
+    def test_desfazer_e_refazer_dependencia(self, gerenciador_limpo):
+        """Testa que desfazer reverte a última dependência, e não o CRUD anterior."""
+        gerenciador_limpo.atualizar_status(1, "Em Progresso")
+        gerenciador_limpo.adicionar_dependencia(2, 1)
+
+        assert gerenciador_limpo.desfazer() is True
+        assert gerenciador_limpo.buscar_tarefa(2).dependencias == []
+        assert gerenciador_limpo.buscar_tarefa(1).status == "Em Progresso"
+        assert 2 in _ids(gerenciador_limpo.listar_prontas())
+
+        assert gerenciador_limpo.refazer() is True
+        assert gerenciador_limpo.buscar_tarefa(2).dependencias == [1]
+        assert 2 not in _ids(gerenciador_limpo.listar_prontas())
+
+        gerenciador_limpo.remover_dependencia(2, 1)
+        assert gerenciador_limpo.desfazer() is True
+        assert gerenciador_limpo.buscar_tarefa(2).dependencias == [1]
+
+    def test_substituir_dependencias_rejeita_ciclo(self, gerenciador_limpo):
+        """Testa que trocar a lista de dependências não fecha um ciclo."""
+        gerenciador_limpo.adicionar_dependencia(2, 1)
+        tarefa = gerenciador_limpo.buscar_tarefa(1)
+
+        with pytest.raises(ValueError):
+            gerenciador_limpo.grafo.substituir_dependencias(tarefa, [2])
+        assert tarefa.dependencias == []
+
+        gerenciador_limpo.grafo.substituir_dependencias(tarefa, [3])
+        assert tarefa.dependencias == [3]
+        assert 1 not in _ids(gerenciador_limpo.listar_prontas())
+
+    def test_listagem_em_cache_reflete_dependencias(self, gerenciador_limpo):
+        """Testa que alterar dependências invalida as listagens em cache."""
+        gerenciador_limpo.listar_tarefas()
+
+        gerenciador_limpo.adicionar_dependencia(2, 1)
+        assert gerenciador_limpo.listar_tarefas()[1].dependencias == (1,)
+
+        gerenciador_limpo.remover_dependencia(2, 1)
+        assert gerenciador_limpo.listar_tarefas()[1].dependencias == ()
+
+    def test_persistencia(self, gerenciador_limpo):
+        """Testa que as dependências são salvas e recarregadas."""
+        gerenciador_limpo.adicionar_dependencia(2, 1)
+
+        gerenciador2 = GerenciadorTarefas(gerenciador_limpo.arquivo_dados)
+
+        assert gerenciador2.buscar_tarefa(2).dependencias == [1]
+        assert _ids(gerenciador2.listar_prontas()) == [1, 3, 4]
+
+    def test_to_dict_copia_lista(self):
+        """Testa que to_dict/from_dict não compartilham a lista de dependências."""
+        tarefa = Tarefa(1, "T")
+        tarefa.dependencias = [2]
+        copia = Tarefa.from_dict(tarefa.to_dict(), confiavel=True)
+        copia.dependencias.append(3)
+
+        assert tarefa.dependencias == [2]
+
+
+class TestCaminhoCritico:
+    """Testes para o cálculo do caminho crítico."""
+
+    def test_maior_cadeia(self, gerenciador_limpo):
+        """Testa que o caminho crítico segue a cadeia mais longa."""
+        gerenciador_limpo.adicionar_dependencia(2, 1)
+        gerenciador_limpo.adicionar_dependencia(3, 2)
+        gerenciador_limpo.adicionar_dependencia(3, 4)
+
+        assert [t.id for t in gerenciador_limpo.caminho_critico()] == [1, 2, 3]
+
+    def test_ignora_concluidas(self, gerenciador_limpo):
+        """Testa que tarefas concluídas não entram no caminho."""
+        gerenciador_limpo.adicionar_dependencia(2, 1)
+        gerenciador_limpo.atualizar_status(1, "Concluído")
+
+        caminho = gerenciador_limpo.caminho_critico()
+        assert len(caminho) == 1
+        assert caminho[0].id != 1
@@ -71,6 +71,29 @@ class TestCriarTarefa:
             gerenciador_limpo.criar_tarefa("    ")
 
 
+class TestCriarTarefasEmLote:
+    """Testes para a criação de tarefas em lote."""
+
+    def test_criar_varias_tarefas(self, gerenciador_limpo):
+        """Testa criação de várias tarefas com IDs sequenciais."""
+        tarefas = gerenciador_limpo.criar_tarefas([
+            {"titulo": "T1", "prioridade": "Alta"},
+            {"titulo": "T2", "descricao": "Desc"},
+        ])
+
+        assert [t.id for t in tarefas] == [1, 2]
+        assert tarefas[0].prioridade == "Alta"
+        assert tarefas[1].descricao == "Desc"
+        assert len(gerenciador_limpo.listar_tarefas()) == 2
+
+    def test_lote_com_titulo_vazio_nao_cria_nada(self, gerenciador_limpo):
+        """Testa que um título inválido rejeita o lote inteiro."""
+        with pytest.raises(ValueError):
+            gerenciador_limpo.criar_tarefas([{"titulo": "T1"}, {"titulo": " "}])
+
+        assert len(gerenciador_limpo.tarefas) == 0
+
+
 class TestListarTarefas:
     """Testes para listagem de tarefas."""
 
@@ -236,6 +259,34 @@ class TestPersistencia:
 
         assert gerenciador2.proximo_id == 3
 
+    def test_carregar_arquivo_com_campos_ausentes(self, gerenciador_limpo):
+        """Testa a carga de registros sem os campos opcionais."""
+        arquivo = gerenciador_limpo.arquivo_dados
+        with open(arquivo, 'w', encoding='utf-8') as f:
+            f.write('{"proximo_id": 2, "tarefas": [{"id": 1, "titulo": "x"}]}')
+
+        gerenciador2 = GerenciadorTarefas(arquivo)
+
+        assert gerenciador2.listar_tarefas(filtro_status="A Fazer")[0].titulo == "x"
+        assert gerenciador2.tarefas[0].prioridade == "Média"
+
+    def test_carregar_arquivo_com_valores_invalidos(self, gerenciador_limpo):
+        """Testa que prioridade e status inválidos são corrigidos na carga."""
+        arquivo = gerenciador_limpo.arquivo_dados
+        with open(arquivo, 'w', encoding='utf-8') as f:
+            f.write(
+                '{"proximo_id": 2, "tarefas": [{"id": 1, "titulo": "x", '
+                '"prioridade": "Urgente", "status": "Feito", "extra": 1}]}'
+            )
+
+        gerenciador2 = GerenciadorTarefas(arquivo)
+
+        tarefa = gerenciador2.tarefas[0]
+        assert tarefa.prioridade == "Média"
+        assert tarefa.status == "A Fazer"
+        assert not hasattr(tarefa, "extra")
+        assert gerenciador2.proxima_tarefa() is tarefa
+
 
 class TestEstatisticas:
     """Testes para estatísticas do sistema."""
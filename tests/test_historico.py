@@ -0,0 +1,142 @@
+"""
+Testes unitários para o histórico de operações (desfazer/refazer).
+"""
+import pytest
+import os
+import sys
+from datetime import datetime
+
+# Adiciona o diretório src ao path para importar os módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.gerenciador import GerenciadorTarefas
+from src.historico import Historico, inverter
+from src.tarefa import Tarefa
+
+
+@pytest.fixture
+def gerenciador_limpo():
+    """Fixture que cria um gerenciador limpo usando arquivo temporário."""
+    arquivo_teste = "data/tarefas_teste_historico.json"
+    if os.path.exists(arquivo_teste):
+        os.remove(arquivo_teste)
+    gerenciador = GerenciadorTarefas(arquivo_teste, intervalo_checkpoint=3)
+    yield gerenciador
+    if os.path.exists(arquivo_teste):
+        os.remove(arquivo_teste)
+
+
+class TestDesfazerRefazer:
+    """Testes para desfazer e refazer operações."""
+
+    def test_desfazer_criacao(self, gerenciador_limpo):
+        """Testa desfazer e refazer a criação de uma tarefa."""
+        gerenciador_limpo.criar_tarefa("T1")
+
+        assert gerenciador_limpo.desfazer() is True
+        assert gerenciador_limpo.buscar_tarefa(1) is None
+        assert gerenciador_limpo.refazer() is True
+        assert gerenciador_limpo.buscar_tarefa(1).titulo == "T1"
+
+    def test_desfazer_status_restaura_conclusao(self, gerenciador_limpo):
+        """Testa que desfazer a conclusão limpa a data de conclusão."""
+        gerenciador_limpo.criar_tarefa("T1")
+        gerenciador_limpo.atualizar_status(1, "Concluído")
+
+        gerenciador_limpo.desfazer()
+        tarefa = gerenciador_limpo.buscar_tarefa(1)
+
+        assert tarefa.status == "A Fazer"
+        assert tarefa.data_conclusao is None
+        assert gerenciador_limpo.listar_tarefas(filtro_status="Concluído") == ()
+
+    def test_desfazer_delecao_preserva_posicao(self, gerenciador_limpo):
+        """Testa que desfazer a deleção reinsere a tarefa na mesma posição."""
+        for titulo in ("T1", "T2", "T3"):
+            gerenciador_limpo.criar_tarefa(titulo, prioridade="Alta")
+        gerenciador_limpo.deletar_tarefa(2)
+        gerenciador_limpo.desfazer()
+
+        assert [t.id for t in gerenciador_limpo.listar_tarefas()] == [1, 2, 3]
+        assert gerenciador_limpo.buscar_tarefa(2).prioridade == "Alta"
+
+    def test_nova_operacao_limpa_refazer(self, gerenciador_limpo):
+        """Testa que uma nova operação descarta o que podia ser refeito."""
+        gerenciador_limpo.criar_tarefa("T1")
+        gerenciador_limpo.desfazer()
+        gerenciador_limpo.criar_tarefa("T2")
+
+        assert gerenciador_limpo.refazer() is False
+
+    def test_nada_para_desfazer(self, gerenciador_limpo):
+        """Testa desfazer sem operações registradas."""
+        assert gerenciador_limpo.desfazer() is False
+
+    def test_inverter_delta(self):
+        """Testa que inverter duas vezes retorna o delta original."""
+        delta = ("alterar", 1, {"status": "A Fazer"}, {"status": "Concluído"})
+        assert inverter(inverter(delta)) == delta
+
+
+class TestEstadoEm:
+    """Testes para a reconstrução de estados passados."""
+
+    def test_estado_em_momento_passado(self, gerenciador_limpo):
+        """Testa a reconstrução atravessando vários checkpoints."""
+        gerenciador_limpo.criar_tarefa("T1")
+        gerenciador_limpo.criar_tarefa("T2")
+        gerenciador_limpo.atualizar_status(1, "Em Progresso")
+        momento = datetime.now()
+        gerenciador_limpo.deletar_tarefa(2)
+        gerenciador_limpo.atualizar_prioridade(1, "Alta")
+        gerenciador_limpo.criar_tarefa("T3")
+        gerenciador_limpo.desfazer()
+
+        passado = gerenciador_limpo.estado_em(momento)
+        assert [t.id for t in passado] == [1, 2]
+        assert passado[0].status == "Em Progresso"
+        assert passado[0].prioridade == "Média"
+
+        atual = gerenciador_limpo.estado_em(datetime.now())
+        assert [t.id for t in atual] == [1]
+        assert atual[0].prioridade == "Alta"
+
+    def test_estado_em_reflete_dependencias(self, gerenciador_limpo):
+        """Testa que as dependências seguem o momento pedido, e não o checkpoint."""
+        gerenciador_limpo.criar_tarefa("T1")
+        gerenciador_limpo.criar_tarefa("T2")
+        gerenciador_limpo.adicionar_dependencia(2, 1)
+        momento = datetime.now()
+        gerenciador_limpo.remover_dependencia(2, 1)
+
+        assert gerenciador_limpo.estado_em(momento)[1].dependencias == [1]
+        assert gerenciador_limpo.estado_em(datetime.now())[1].dependencias == []
+
+    def test_estado_em_texto_inclui_o_segundo(self, gerenciador_limpo):
+        """Testa que um momento em texto inclui as operações daquele segundo."""
+        tarefa = gerenciador_limpo.criar_tarefa("T1")
+
+        passado = gerenciador_limpo.estado_em(tarefa.data_criacao)
+
+        assert [t.id for t in passado] == [1]
+
+    def test_estado_antes_do_historico(self, gerenciador_limpo):
+        """Testa que momentos anteriores ao histórico são rejeitados."""
+        with pytest.raises(ValueError):
+            gerenciador_limpo.estado_em("2000-01-01 00:00:00")
+
+    def test_historico_limitado(self):
+        """Testa que checkpoints e operações antigos são descartados."""
+        tarefas = []
+        historico = Historico(tarefas, intervalo_checkpoint=2, max_checkpoints=2)
+        inicio = datetime.now()
+        for i in range(1, 11):
+            tarefas.append(Tarefa(i, f"T{i}"))
+            historico.registrar(("criar", tarefas[-1].to_dict(), i - 1), tarefas)
+
+        assert len(historico._checkpoints) == 2
+        assert len(historico._operacoes) <= 4
+        assert len(historico._desfazer) == 4
+        assert [t.id for t in historico.estado_em(datetime.now())] == list(range(1, 11))
+        with pytest.raises(ValueError):
+            historico.estado_em(inicio)
@@ -0,0 +1,93 @@
+"""
+Testes para o modo de perfilamento do gerenciador.
+"""
+import pytest
+import io
+import json
+import os
+import sys
+
+# Adiciona o diretório src ao path para importar os módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src import perfilamento
+from src.gerenciador import GerenciadorTarefas
+
+
+@pytest.fixture
+def arquivo_dados(tmp_path):
+    """Fixture que cria um quadro com algumas tarefas."""
+    caminho = str(tmp_path / "tarefas.json")
+    gerenciador = GerenciadorTarefas(caminho)
+    for i in range(5):
+        gerenciador.criar_tarefa(f"Tarefa {i}")
+    return caminho
+
+
+class TestPerfilamento:
+    """Testes para a reprodução de traces e o relatório."""
+
+    def test_percentis(self):
+        """Testa os percentis pelo posto mais próximo."""
+        amostras = list(range(1, 101))
+        assert perfilamento.percentis(amostras) == {50: 50, 90: 90, 99: 99}
+        assert perfilamento.percentis([7]) == {50: 7, 90: 7, 99: 7}
+
+    def test_trace_sintetico_sem_erros(self, arquivo_dados):
+        """Testa que o trace sintético só referencia tarefas existentes."""
+        operacoes = perfilamento.gerar_trace_sintetico(300, primeiro_id=6)
+        gerenciador = GerenciadorTarefas(arquivo_dados)
+
+        latencias, erros = perfilamento.reproduzir(gerenciador, operacoes)
+
+        assert erros == {}
+        assert sum(len(v) for v in latencias.values()) == 300
+        assert all(gerenciador.deletar_tarefa(o["args"][0]) is False
+                   for o in operacoes if o["metodo"] == "deletar_tarefa")
+
+    def test_ler_trace(self, tmp_path):
+        """Testa a ida e volta do trace e a rejeição de métodos privados."""
+        caminho = str(tmp_path / "trace.jsonl")
+        operacoes = perfilamento.gerar_trace_sintetico(20)
+        perfilamento.salvar_trace(caminho, operacoes)
+        assert perfilamento.ler_trace(caminho) == operacoes
+
+        with open(caminho, 'a', encoding='utf-8') as arquivo:
+            arquivo.write(json.dumps({"metodo": "salvar_tarefas"}) + "\n")
+        with pytest.raises(ValueError):
+            perfilamento.ler_trace(caminho)
+
+    @pytest.mark.parametrize("perfil", perfilamento.PERFIS)
+    def test_executar_preserva_arquivo(self, arquivo_dados, perfil):
+        """Testa que a reprodução usa uma cópia do arquivo de dados."""
+        with open(arquivo_dados, 'rb') as arquivo:
+            original = arquivo.read()
+        saida = io.StringIO()
+
+        relatorio = perfilamento.executar(
+            arquivo_dados, perfilamento.gerar_trace_sintetico(50, primeiro_id=6),
+            perfil=perfil, top=3, saida=saida, medir_import=False,
+        )
+
+        with open(arquivo_dados, 'rb') as arquivo:
+            assert arquivo.read() == original
+        assert relatorio["tarefas"] == 5
+        assert "criar_tarefa" in relatorio["latencias"]
+        texto = saida.getvalue()
+        assert "Latência por operação" in texto
+        if perfil == "cprofile":
+            assert "Pontos quentes" in texto
+        if perfil == "tracemalloc":
+            assert relatorio["pico_reproducao"] > 0
+
+    def test_medir_importacao(self):
+        """Testa que a importação é medida em um interpretador separado."""
+        assert 0 < perfilamento.medir_importacao() < 30
+
+    def test_main_sem_trace_roda_demonstracao(self, tmp_path, capsys):
+        """Testa que sem trace o ponto de entrada mantém a demonstração."""
+        caminho = str(tmp_path / "tarefas.json")
+        perfilamento.main(["--arquivo", caminho])
+
+        assert "Total de tarefas: 3" in capsys.readouterr().out
+        assert len(GerenciadorTarefas(caminho).tarefas) == 3
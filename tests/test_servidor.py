@@ -0,0 +1,159 @@
+"""
+Testes para o servidor de tarefas e seu cliente via socket Unix.
+"""
+import pytest
+import os
+import shutil
+import socket
+import stat
+import sys
+import tempfile
+import threading
+
+# Adiciona o diretório src ao path para importar os módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.cliente import ClienteTarefas
+from src.gerenciador import GerenciadorTarefas, LimiteWIPExcedido
+from src.servidor import ServidorTarefas
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Sockets Unix indisponíveis"
+)
+
+
+@pytest.fixture
+def servidor():
+    """Fixture que inicia um servidor em uma thread com diretório temporário."""
+    diretorio = tempfile.mkdtemp()
+    gerenciador = GerenciadorTarefas(
+        os.path.join(diretorio, "tarefas.json"), limites_wip={"Em Progresso": 1}
+    )
+    servidor = ServidorTarefas(gerenciador, os.path.join(diretorio, "tarefas.sock"))
+    thread = threading.Thread(target=servidor.serve_forever, daemon=True)
+    thread.start()
+    yield servidor
+    servidor.shutdown()
+    servidor.server_close()
+    shutil.rmtree(diretorio)
+
+
+@pytest.fixture
+def cliente(servidor):
+    """Fixture que conecta um cliente ao servidor."""
+    with ClienteTarefas(servidor.caminho_socket) as cliente:
+        yield cliente
+
+
+class TestClienteTarefas:
+    """Testes para as chamadas feitas pelo cliente."""
+
+    def test_crud_remoto(self, cliente, servidor):
+        """Testa as operações CRUD pelo socket."""
+        tarefa = cliente.criar_tarefa("Remota", "Desc", prioridade="Alta")
+        assert tarefa.id == 1
+        assert tarefa.prioridade == "Alta"
+
+        assert cliente.atualizar_status(1, "Concluído") is True
+        assert cliente.buscar_tarefa(1).status == "Concluído"
+        assert cliente.obter_estatisticas()["por_status"]["Concluído"] == 1
+        assert cliente.deletar_tarefa(1) is True
+        assert cliente.buscar_tarefa(1) is None
+        assert servidor.gerenciador.tarefas == []
+
+    def test_listar_com_filtros(self, cliente):
+        """Testa a listagem com argumentos nomeados."""
+        cliente.criar_tarefa("T1", prioridade="Alta")
+        cliente.criar_tarefa("T2", prioridade="Baixa")
+
+        tarefas = cliente.listar_tarefas(filtro_prioridade="Baixa")
+        assert [t.titulo for t in tarefas] == ["T2"]
+
+    def test_pipeline(self, cliente):
+        """Testa várias requisições enviadas antes de ler as respostas."""
+        resultados = cliente.em_lote(
+            [("criar_tarefa", [f"T{i}"]) for i in range(50)]
+            + [("obter_estatisticas", [])]
+        )
+
+        assert [t.id for t in resultados[:50]] == list(range(1, 51))
+        assert resultados[50]["total"] == 50
+
+    def test_pipeline_maior_que_buffer(self, cliente):
+        """Testa um lote cujas respostas não cabem no buffer do socket."""
+        cliente.criar_tarefa("T1")
+        resultados = []
+        thread = threading.Thread(
+            target=lambda: resultados.extend(
+                cliente.em_lote([("obter_estatisticas", [])] * 5000)
+            ),
+            daemon=True,
+        )
+        thread.start()
+        thread.join(timeout=30)
+
+        assert not thread.is_alive()
+        assert len(resultados) == 5000
+        assert resultados[-1]["total"] == 1
+
+    def test_erros_repassados(self, cliente):
+        """Testa que os erros do gerenciador chegam ao cliente."""
+        with pytest.raises(ValueError):
+            cliente.criar_tarefa("")
+
+        cliente.criar_tarefas([{"titulo": "T1"}, {"titulo": "T2"}])
+        cliente.puxar_tarefa("ana")
+        with pytest.raises(LimiteWIPExcedido) as erro:
+            cliente.puxar_tarefa("bia")
+        assert erro.value.limite == 1
+
+    def test_metodo_desconhecido(self, cliente):
+        """Testa que apenas métodos públicos do gerenciador são expostos."""
+        with pytest.raises(AttributeError):
+            cliente.salvar_tarefas()
+
+    def test_clientes_compartilham_estado(self, cliente, servidor):
+        """Testa que dois clientes enxergam o mesmo gerenciador."""
+        cliente.criar_tarefa("Compartilhada")
+        with ClienteTarefas(servidor.caminho_socket) as outro:
+            assert outro.buscar_tarefa(1).titulo == "Compartilhada"
+
+
+def test_gravar_trace(tmp_path):
+    """Testa que o servidor grava as chamadas recebidas em um trace."""
+    from src.perfilamento import ler_trace
+
+    gerenciador = GerenciadorTarefas(str(tmp_path / "tarefas.json"))
+    trace = str(tmp_path / "trace.jsonl")
+    servidor = ServidorTarefas(gerenciador, str(tmp_path / "tarefas.sock"), trace)
+    thread = threading.Thread(target=servidor.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with ClienteTarefas(servidor.caminho_socket) as cliente:
+            cliente.criar_tarefa("T1", prioridade="Alta")
+            cliente.listar_tarefas()
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
+
+    assert ler_trace(trace) == [
+        {"metodo": "criar_tarefa", "args": ["T1"], "kwargs": {"prioridade": "Alta"}},
+        {"metodo": "listar_tarefas", "args": [], "kwargs": {}},
+    ]
+
+
+def test_nao_remove_arquivo_que_nao_e_socket(tmp_path):
+    """Testa que um caminho de socket errado não apaga o arquivo existente."""
+    gerenciador = GerenciadorTarefas(str(tmp_path / "tarefas.json"))
+    gerenciador.criar_tarefa("T1")
+
+    with pytest.raises(ValueError):
+        ServidorTarefas(gerenciador, gerenciador.arquivo_dados)
+
+    assert GerenciadorTarefas(gerenciador.arquivo_dados).tarefas[0].titulo == "T1"
+
+
+def test_socket_restrito_ao_dono(servidor):
+    """Testa que outros usuários não têm acesso ao socket."""
+    modo = stat.S_IMODE(os.stat(servidor.caminho_socket).st_mode)
+    assert modo == 0o600
@@ -0,0 +1,118 @@
+"""
+Testes unitários para os snapshots imutáveis do quadro.
+"""
+import pytest
+import os
+import sys
+
+# Adiciona o diretório src ao path para importar os módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.gerenciador import GerenciadorTarefas
+from src.snapshot import QuadroVersionado, TAMANHO_BLOCO
+from src.tarefa import Tarefa
+
+
+@pytest.fixture
+def gerenciador_limpo():
+    """Fixture que cria um gerenciador limpo usando arquivo temporário."""
+    arquivo_teste = "data/tarefas_teste_snapshot.json"
+    if os.path.exists(arquivo_teste):
+        os.remove(arquivo_teste)
+    gerenciador = GerenciadorTarefas(arquivo_teste)
+    yield gerenciador
+    if os.path.exists(arquivo_teste):
+        os.remove(arquivo_teste)
+
+
+class TestQuadroVersionado:
+    """Testes para a estrutura persistente de blocos."""
+
+    def test_versoes_antigas_nao_mudam(self):
+        """Testa que um snapshot não enxerga escritas posteriores."""
+        quadro = QuadroVersionado()
+        tarefa = Tarefa(1, "T1")
+        quadro.anexar(tarefa)
+        antigo = quadro.snapshot()
+
+        tarefa.atualizar_status("Concluído")
+        quadro.atualizar(tarefa)
+        quadro.anexar(Tarefa(2, "T2"))
+
+        assert len(antigo) == 1
+        assert antigo.buscar(1).status == "A Fazer"
+        assert quadro.snapshot().buscar(1).status == "Concluído"
+        assert quadro.snapshot().versao > antigo.versao
+
+    def test_blocos_compartilhados(self):
+        """Testa que blocos não alterados são compartilhados entre versões."""
+        quadro = QuadroVersionado([Tarefa(i, f"T{i}") for i in range(1, 2 * TAMANHO_BLOCO + 1)])
+        antes = quadro.snapshot()
+        quadro.remover(1)
+        depois = quadro.snapshot()
+
+        assert antes._blocos[1] is depois._blocos[1]
+        assert len(antes) == 2 * TAMANHO_BLOCO
+        assert len(depois) == 2 * TAMANHO_BLOCO - 1
+        assert depois.buscar(1) is None
+
+    def test_inserir_mantem_ordem(self):
+        """Testa a inserção na lacuna de uma remoção, no meio e no fim."""
+        tarefas = [Tarefa(i, f"T{i}") for i in range(1, 2 * TAMANHO_BLOCO + 1)]
+        quadro = QuadroVersionado(tarefas)
+        quadro.remover(TAMANHO_BLOCO + 1)
+        quadro.inserir(TAMANHO_BLOCO, tarefas[TAMANHO_BLOCO])
+        assert [r.id for r in quadro.snapshot()] == [t.id for t in tarefas]
+
+        antes = quadro.snapshot()
+        quadro.inserir(1, Tarefa(100, "T100"))
+        quadro.inserir(len(tarefas) + 1, Tarefa(101, "T101"))
+        depois = quadro.snapshot()
+
+        assert [r.id for r in depois] == [1, 100] + list(range(2, 2 * TAMANHO_BLOCO + 1)) + [101]
+        assert antes._blocos[1] is depois._blocos[1]
+        quadro.atualizar(Tarefa(3, "Alterada"))
+        assert quadro.snapshot().buscar(3).titulo == "Alterada"
+
+    def test_registro_imutavel(self):
+        """Testa que os registros não podem ser alterados."""
+        quadro = QuadroVersionado([Tarefa(1, "T1")])
+        registro = quadro.snapshot().buscar(1)
+
+        with pytest.raises(AttributeError):
+            registro.status = "Concluído"
+
+
+class TestSnapshotGerenciador:
+    """Testes para o snapshot exposto pelo gerenciador."""
+
+    def test_snapshot_reflete_operacoes(self, gerenciador_limpo):
+        """Testa que o snapshot acompanha as operações CRUD."""
+        gerenciador_limpo.criar_tarefa("T1", prioridade="Alta")
+        gerenciador_limpo.criar_tarefa("T2")
+        gerenciador_limpo.criar_tarefa("T3")
+        gerenciador_limpo.atualizar_status(1, "Em Progresso")
+        gerenciador_limpo.atualizar_prioridade(2, "Baixa")
+        gerenciador_limpo.deletar_tarefa(3)
+
+        snapshot = gerenciador_limpo.snapshot()
+        assert [r.id for r in snapshot] == [1, 2]
+        assert snapshot.listar(filtro_status="Em Progresso")[0].id == 1
+        assert snapshot.listar(filtro_prioridade="Baixa")[0].id == 2
+
+    def test_desfazer_delecao_mantem_ordem(self, gerenciador_limpo):
+        """Testa que desfazer uma deleção devolve a tarefa à mesma posição."""
+        for titulo in ("T1", "T2", "T3"):
+            gerenciador_limpo.criar_tarefa(titulo)
+        gerenciador_limpo.deletar_tarefa(1)
+        gerenciador_limpo.desfazer()
+
+        assert [t.id for t in gerenciador_limpo.listar_tarefas()] == [1, 2, 3]
+        assert [r.id for r in gerenciador_limpo.snapshot()] == [1, 2, 3]
+
+    def test_snapshot_apos_carregar(self, gerenciador_limpo):
+        """Testa que o snapshot é reconstruído ao carregar o arquivo."""
+        gerenciador_limpo.criar_tarefa("T1")
+        gerenciador2 = GerenciadorTarefas(gerenciador_limpo.arquivo_dados)
+
+        assert [r.titulo for r in gerenciador2.snapshot()] == ["T1"]
@@ -9,7 +9,7 @@ import sys
 # Adiciona o diretório src ao path para importar os módulos
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from src.tarefa import Tarefa
+from src.tarefa import FORMATO_DATA, Tarefa, agora
 
 
 class TestCriacaoTarefa:
@@ -182,6 +182,31 @@ class TestConversaoDicionario:
         assert tarefa_reconstruida.status == tarefa_original.status
         assert tarefa_reconstruida.prioridade == tarefa_original.prioridade
 
+    def test_from_dict_confiavel(self):
+        """Testa o caminho rápido para dados produzidos por to_dict."""
+        tarefa_original = Tarefa(7, "Confiável", "Desc", "Baixa")
+        tarefa_original.atualizar_status("Concluído")
+
+        tarefa = Tarefa.from_dict(tarefa_original.to_dict(), confiavel=True)
+
+        assert tarefa.to_dict() == tarefa_original.to_dict()
+
+    def test_from_dict_confiavel_completa_campos(self):
+        """Testa que o caminho rápido preenche campos ausentes."""
+        tarefa = Tarefa.from_dict({"id": 1, "titulo": "x"}, confiavel=True)
+
+        assert tarefa.descricao == ""
+        assert tarefa.prioridade == "Média"
+        assert tarefa.status == "A Fazer"
+        assert tarefa.data_criacao is not None
+        assert tarefa.data_conclusao is None
+        assert tarefa.dependencias == []
+
+    def test_from_dict_preserva_data_criacao(self):
+        """Testa que from_dict não gera nova data quando ela existe."""
+        tarefa = Tarefa.from_dict({"id": 1, "titulo": "T", "data_criacao": "2020-01-01 00:00:00"})
+        assert tarefa.data_criacao == "2020-01-01 00:00:00"
+
 
 class TestRepresentacaoString:
     """Testes para representações em string."""
@@ -233,6 +258,30 @@ class TestValidacaoDados:
         assert tarefa2.descricao == "Com descrição"
 
 
+class TestDataCriacao:
+    """Testes para a geração de datas."""
+
+    def test_agora_no_formato(self):
+        """Testa que agora() segue o formato de datas das tarefas."""
+        from datetime import datetime
+        assert datetime.strptime(agora(), FORMATO_DATA)
+
+    def test_agora_acompanha_o_segundo(self, monkeypatch):
+        """Testa que o texto em cache é trocado junto com o segundo."""
+        import time
+        from src import tarefa as modulo
+        for segundo in (1700000000.2, 1700000000.9, 1700000001.0):
+            monkeypatch.setattr(time, "time", lambda: segundo)
+            esperado = time.strftime(FORMATO_DATA, time.localtime(int(segundo)))
+            assert agora() == esperado
+            assert modulo._ultimo_timestamp == (int(segundo), esperado)
+
+    def test_data_criacao_informada(self):
+        """Testa que a data de criação pode ser informada."""
+        tarefa = Tarefa(1, "Teste", data_criacao="2024-01-01 10:00:00")
+        assert tarefa.data_criacao == "2024-01-01 10:00:00"
+
+
 class TestFluxoCompleto:
     """Testes de fluxo completo de uma tarefa."""
 
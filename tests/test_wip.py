@@ -0,0 +1,143 @@
+"""
+Testes unitários para os limites de trabalho em progresso (WIP).
+"""
+import pytest
+import os
+import sys
+
+# Adiciona o diretório src ao path para importar os módulos
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.gerenciador import GerenciadorTarefas, LimiteWIPExcedido
+
+ARQUIVO_TESTE = "data/tarefas_teste_wip.json"
+
+
+@pytest.fixture
+def gerenciador_wip():
+    """Fixture que cria um gerenciador com limite de 2 tarefas em progresso."""
+    if os.path.exists(ARQUIVO_TESTE):
+        os.remove(ARQUIVO_TESTE)
+    gerenciador = GerenciadorTarefas(ARQUIVO_TESTE, limites_wip={"Em Progresso": 2})
+    gerenciador.criar_tarefas([{"titulo": f"T{i}"} for i in range(1, 5)])
+    yield gerenciador
+    if os.path.exists(ARQUIVO_TESTE):
+        os.remove(ARQUIVO_TESTE)
+
+
+class TestLimiteWIP:
+    """Testes para a aplicação dos limites WIP."""
+
+    def test_rejeita_acima_do_limite(self, gerenciador_wip):
+        """Testa que a transição que ultrapassa o limite é rejeitada."""
+        gerenciador_wip.atualizar_status(1, "Em Progresso")
+        gerenciador_wip.atualizar_status(2, "Em Progresso")
+
+        with pytest.raises(LimiteWIPExcedido) as erro:
+            gerenciador_wip.atualizar_status(3, "Em Progresso")
+
+        assert erro.value.coluna == "Em Progresso"
+        assert erro.value.limite == 2
+        assert gerenciador_wip.buscar_tarefa(3).status == "A Fazer"
+
+    def test_mesma_coluna_nao_conta(self, gerenciador_wip):
+        """Testa que reaplicar o status atual não é bloqueado."""
+        gerenciador_wip.atualizar_status(1, "Em Progresso")
+        gerenciador_wip.atualizar_status(2, "Em Progresso")
+
+        assert gerenciador_wip.atualizar_status(1, "Em Progresso") is True
+
+    def test_limite_na_criacao(self):
+        """Testa que criar tarefas respeita o limite da coluna A Fazer."""
+        if os.path.exists(ARQUIVO_TESTE):
+            os.remove(ARQUIVO_TESTE)
+        gerenciador = GerenciadorTarefas(ARQUIVO_TESTE, limites_wip={"A Fazer": 2})
+        try:
+            gerenciador.criar_tarefa("T1")
+            with pytest.raises(LimiteWIPExcedido):
+                gerenciador.criar_tarefas([{"titulo": "T2"}, {"titulo": "T3"}])
+            assert len(gerenciador.tarefas) == 1
+        finally:
+            if os.path.exists(ARQUIVO_TESTE):
+                os.remove(ARQUIVO_TESTE)
+
+    def test_lote_tudo_ou_nada(self, gerenciador_wip):
+        """Testa que o lote inteiro é rejeitado se não couber na coluna."""
+        with pytest.raises(LimiteWIPExcedido):
+            gerenciador_wip.atualizar_status_em_lote([1, 2, 3], "Em Progresso")
+
+        assert gerenciador_wip.listar_tarefas(filtro_status="Em Progresso") == ()
+        movidas = gerenciador_wip.atualizar_status_em_lote([1, 2], "Em Progresso")
+        assert [t.id for t in movidas] == [1, 2]
+
+    def test_puxar_respeita_limite(self, gerenciador_wip):
+        """Testa que puxar tarefa também respeita o limite."""
+        gerenciador_wip.puxar_tarefa("ana")
+        gerenciador_wip.puxar_tarefa("bia")
+
+        with pytest.raises(LimiteWIPExcedido):
+            gerenciador_wip.puxar_tarefa("caio")
+
+
+class TestFilaWIP:
+    """Testes para transições enfileiradas."""
+
+    def test_enfileira_e_aplica_ao_liberar(self, gerenciador_wip):
+        """Testa que a transição bloqueada é aplicada quando há espaço."""
+        gerenciador_wip.atualizar_status(1, "Em Progresso")
+        gerenciador_wip.atualizar_status(2, "Em Progresso")
+
+        assert gerenciador_wip.atualizar_status(3, "Em Progresso", enfileirar=True) is False
+        assert gerenciador_wip.fila_wip() == {"Em Progresso": [3]}
+
+        gerenciador_wip.atualizar_status(1, "Concluído")
+
+        assert gerenciador_wip.buscar_tarefa(3).status == "Em Progresso"
+        assert gerenciador_wip.fila_wip() == {}
+
+    def test_mudanca_explicita_descarta_fila(self, gerenciador_wip):
+        """Testa que a fila não desfaz uma mudança de status posterior."""
+        gerenciador_wip.atualizar_status(1, "Em Progresso")
+        gerenciador_wip.atualizar_status(2, "Em Progresso")
+        gerenciador_wip.atualizar_status(3, "Em Progresso", enfileirar=True)
+
+        gerenciador_wip.atualizar_status(3, "Concluído")
+        assert gerenciador_wip.fila_wip() == {}
+        gerenciador_wip.atualizar_status(1, "Concluído")
+
+        tarefa = gerenciador_wip.buscar_tarefa(3)
+        assert tarefa.status == "Concluído"
+        assert tarefa.data_conclusao is not None
+
+    def test_deletar_libera_espaco(self, gerenciador_wip):
+        """Testa que deletar uma tarefa também libera a fila."""
+        gerenciador_wip.atualizar_status(1, "Em Progresso")
+        gerenciador_wip.atualizar_status(2, "Em Progresso")
+        gerenciador_wip.atualizar_status(3, "Em Progresso", enfileirar=True)
+
+        gerenciador_wip.deletar_tarefa(2)
+
+        assert gerenciador_wip.buscar_tarefa(3).status == "Em Progresso"
+
+    def test_fila_em_cascata(self):
+        """Testa que liberar uma coluna aplica as transições em cadeia."""
+        if os.path.exists(ARQUIVO_TESTE):
+            os.remove(ARQUIVO_TESTE)
+        gerenciador = GerenciadorTarefas(
+            ARQUIVO_TESTE, limites_wip={"Em Progresso": 1, "Concluído": 1}
+        )
+        try:
+            gerenciador.criar_tarefas([{"titulo": f"T{i}"} for i in range(1, 4)])
+            gerenciador.atualizar_status(3, "Concluído")
+            gerenciador.atualizar_status(1, "Em Progresso")
+            gerenciador.atualizar_status(2, "Em Progresso", enfileirar=True)
+            gerenciador.atualizar_status(1, "Concluído", enfileirar=True)
+
+            gerenciador.deletar_tarefa(3)
+
+            assert gerenciador.buscar_tarefa(1).status == "Concluído"
+            assert gerenciador.buscar_tarefa(2).status == "Em Progresso"
+            assert gerenciador.fila_wip() == {}
+        finally:
+            if os.path.exists(ARQUIVO_TESTE):
+                os.remove(ARQUIVO_TESTE)